@@ -12,6 +12,7 @@ import random
 import string
 import csv
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional
 from pathlib import Path
 import fitz  # PyMuPDF for PDF manipulation
@@ -365,6 +366,52 @@ def generate_paper(json_file, output_name=None, show_answers=False, paper_set="A
             traceback.print_exc()
         raise
 
+def _set_label(index: int) -> str:
+    """Return the set name for a zero-based paper index: A..Z, then AA, AB, ..."""
+    label = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        label = string.ascii_uppercase[remainder] + label
+    return label
+
+def _render_paper_bytes(job) -> bytes:
+    """Render one paper from (config, set_name, sections, generator options) and return the PDF bytes."""
+    config, set_name, sections, options = job
+    pdf = EnhancedMCQPaperGenerator(config=config, **options)
+    pdf.set_set_name(set_name)
+    pdf.add_page()
+    pdf.generate_from_sections(sections)
+    return bytes(pdf.output())
+
+def generate_papers_parallel(
+    sections_list: List[List[SectionConfig]],
+    config: MCQConfig,
+    n_workers: Optional[int] = None,
+    set_names: Optional[List[str]] = None,
+    **generator_options
+) -> List[bytes]:
+    """Render one paper per sections list across worker processes and return the PDF bytes in order.
+
+    Papers are independent documents, so each is laid out by its own generator in a
+    separate process. set_names labels the papers in list order and defaults to
+    A..Z, AA, AB, ...; generator_options are passed to every EnhancedMCQPaperGenerator
+    (e.g. show_answers, question_count).
+    """
+    if set_names is None:
+        set_names = [_set_label(i) for i in range(len(sections_list))]
+    elif len(set_names) != len(sections_list):
+        raise ValueError(
+            f"Got {len(set_names)} set names for {len(sections_list)} papers."
+        )
+
+    jobs = [
+        (config, set_name, sections, generator_options)
+        for set_name, sections in zip(set_names, sections_list)
+    ]
+    with ProcessPoolExecutor(max_workers=n_workers or os.cpu_count()) as executor:
+        return list(executor.map(_render_paper_bytes, jobs))
+
 def generate_enhanced_mcq_sets_with_keys(
     sections_data: List[Dict],
     num_sets: int,
@@ -3,11 +3,20 @@ try:
 except ImportError:
     print("Error importing fpdf. Please make sure it's installed with 'pip install fpdf==1.7.2'")
     raise
+import logging
 import os
 from typing import Optional, Dict, Set, List, Tuple
 from functools import lru_cache
 from .styles import PaperStyles
 
+log = logging.getLogger(__name__)
+
+# Option labels ("A.", "B.", ...) indexed by choice position
+_CHOICE_LABELS = tuple(f"{chr(65 + i)}." for i in range(26))
+
+# Stands in for fpdf2 attributes that may not exist in other fpdf2 versions
+_MISSING = object()
+
 class PaperConfig:
     """Base configuration class for all paper generators."""
     
@@ -60,6 +69,8 @@ class BasePaperGenerator(FPDF):
         
         super().__init__(orientation='P', unit='mm', format=paper_format)
         self._initialized_fonts: Set[Tuple[str, str]] = set()
+        self._text_height_cache: Dict[Tuple[str, float, int], float] = {}
+        self._choice_rows_cache: Dict[Tuple[str, ...], Tuple[Tuple[int, bool], ...]] = {}
         self.config = config or PaperConfig()
         self.show_answers = show_answers
         self.question_count = question_count
@@ -76,10 +87,33 @@ class BasePaperGenerator(FPDF):
         self.column_height = 0
         self.first_page_offset = 0
         
+        # Cache the style values read for every question
+        self._line_height = self.config.spacing['line_height']
+        self._question_number_width = self.config.spacing['question_number_width']
+        self._option_column_gap = self.config.spacing['option_column_gap']
+        self._question_number_font_size = self.config.font_sizes['question_number']
+        self._question_font_size = self.config.font_sizes['question']
+        self._option_label_font_size = self.config.font_sizes['option_label']
+        self._option_font_size = self.config.font_sizes['option']
+
         # Precompute common measurements
         self._column_width = (self.w/2) - self.config.spacing['column_spacing']
-        self._question_width = self._column_width - self.config.spacing['question_number_width'] - 1
-        self._options_width = self._column_width - self.config.spacing['question_number_width'] - 3
+        self._question_width = self._column_width - self._question_number_width - 1
+        self._options_width = self._column_width - self._question_number_width - 3
+        self._half_options_width = (self._options_width - self._option_column_gap) / 2
+        # Statements, lists, tables and paragraphs sit 5mm in from the question text
+        self._indented_width = self._question_width - 5
+
+        # Option text render widths: the 5mm label cell gives back 1mm, so text
+        # is 4mm narrower than its slot, either full width or one of two halves
+        label_adjustment = 4
+        self._single_option_render_width = self._options_width - label_adjustment
+        self._half_option_render_width = self._half_options_width - label_adjustment
+
+        # Page geometry used by every column/page fit check
+        self._right_column_x = self.w/2 + 2
+        self._effective_page_height = self.h - self.footer_buffer
+
 
     def set_set_name(self, name: str) -> None:
         """Set the name of the current set (A, B, C, etc.)."""
@@ -93,8 +127,55 @@ class BasePaperGenerator(FPDF):
         """
         return self.config.spacing['footer_height']
 
+    # Top of the question columns on the current page, refreshed by add_page
+    _column_top: float = 20
+
+    def add_page(self, *args, **kwargs):
+        """Start a new page and record where its question columns begin.
+
+        Only the first page's header pushes the columns down, so the offset is
+        resolved once per page rather than in every column/page fit check.
+        """
+        super().add_page(*args, **kwargs)
+        self._column_top = self.first_page_offset + 5 if self.page_no() == 1 else 20
+
+    # Last set_font request and the font state it produced
+    _font_request: Optional[Tuple] = None
+    _font_state: Optional[Tuple] = None
+
+    def set_font(self, family=None, style='', size=0):
+        """Select a font, returning early when the same request is already active.
+
+        FPDF normalizes the family/style on every call before noticing that the
+        font is unchanged; the generators re-select fonts several times per
+        question, so repeated requests are answered from the last one instead.
+        Comparing against FPDF's own state keeps this correct across add_page,
+        which clears the current font.
+        """
+        request = (family, style, size)
+        if (request == self._font_request
+                and self._font_state == (self.font_family, self.font_style, self.font_size_pt)):
+            return
+        super().set_font(family, style, size)
+        self._font_request = request
+        self._font_state = (self.font_family, self.font_style, self.font_size_pt)
+
     # Class-level font cache to prevent reloading fonts
     _global_font_cache = {}
+
+    # Upper bound on memoized text heights per generator
+    TEXT_HEIGHT_CACHE_SIZE = 4096
+
+    # Class-level cache of section header heights, shared across paper sets;
+    # bounded like the text-height memo, oldest entries evicted first
+    _section_measure_cache: Dict[Tuple, Tuple[float, float]] = {}
+    SECTION_MEASURE_CACHE_SIZE = 256
+
+    # Class-level widths of individual words in unscaled glyph units, per font
+    # file; they depend on nothing else, so every generator in the process shares them.
+    # Each font's table is bounded; once full, the oldest words are evicted first
+    _word_units_cache: Dict[str, Dict[str, int]] = {}
+    WORD_UNITS_CACHE_SIZE = 16384
     
     def _initialize_fonts(self) -> None:
         """Initialize fonts with fallback to standard fonts if custom fonts are not available."""
@@ -104,7 +185,7 @@ class BasePaperGenerator(FPDF):
                 try:
                     if not os.path.exists(path):
                         if font_key not in self._global_font_cache:
-                            print(f"Warning: Font file not found: {path}")
+                            log.warning("Font file not found: %s", path)
                             self._global_font_cache[font_key] = 'fallback'
                         # Use fallback fonts
                         if font_family == 'Stinger':
@@ -125,7 +206,7 @@ class BasePaperGenerator(FPDF):
                         self._initialized_fonts.add(font_key)
                 except Exception as e:
                     if font_key not in self._global_font_cache:
-                        print(f"Warning: Could not load font {font_family} {style}: {e}")
+                        log.warning("Could not load font %s %s: %s", font_family, style, e)
                         self._global_font_cache[font_key] = 'error'
                     # Use fallback fonts
                     if font_family == 'Stinger':
@@ -159,44 +240,147 @@ class BasePaperGenerator(FPDF):
         self.set_font(font_family, font_style, font_size)
         return self.get_string_width(text)
 
-    @lru_cache(maxsize=1024)
     def estimate_text_height(self, text: str, width: float, font_size: int = 12) -> float:
-        """Calculate the approximate height needed for text at given width and font size."""
+        """Calculate the approximate height needed for text at given width and font size.
+
+        Results are memoized per generator, so repeated measurements of the same
+        text (shared choices, re-measured questions after an overflow) are free.
+        The memo is bounded; once full, the oldest entries are evicted first.
+        """
+        cache_key = (text, width, font_size)
+        cache = self._text_height_cache
+        height = cache.get(cache_key)
+        if height is None:
+            height = self._wrap_text_height(text, width, font_size)
+            if len(cache) >= self.TEXT_HEIGHT_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[cache_key] = height
+        return height
+
+    def _wrap_text_height(self, text: str, width: float, font_size: int) -> float:
+        """Word-wrap text at the given width and return the resulting height."""
         self.set_font('Noto', '', font_size)
         words = text.split()
+        
+        if self._has_additive_widths(text):
+            lines = self._count_wrapped_lines(words, width)
+        else:
+            lines = 1
+            current_line = ''
+            
+            for word in words:
+                test_line = current_line + ' ' + word if current_line else word
+                if self.get_string_width(test_line) > width:
+                    lines += 1
+                    current_line = word
+                else:
+                    current_line = test_line
+        
+        return lines * self._line_height
+
+    def _has_additive_widths(self, text: str) -> bool:
+        """Whether the width of text in the current font is a plain sum of glyph widths.
+
+        True for embedded TrueType fonts without text shaping, stretching, character
+        spacing or fallback fonts, which is how every generator sets up its fonts.
+        Part of this is fpdf2 internal state, so it is read defensively: if a newer
+        fpdf2 renames any of it, this returns False and wrapping takes the slow path
+        through get_string_width.
+        """
+        alias = getattr(self, 'str_alias_nb_pages', _MISSING)
+        return (getattr(self, 'is_ttf_font', False)
+                and not getattr(self, 'text_shaping', True)
+                and not getattr(self, '_fallback_font_ids', True)
+                and getattr(self, 'font_stretching', None) == 100
+                and getattr(self, 'char_spacing', None) == 0
+                and alias is not _MISSING and not (alias and alias in text)
+                and hasattr(self.current_font, 'cw') and hasattr(self.current_font, 'ttffile'))
+
+    def _count_wrapped_lines(self, words: List[str], width: float) -> int:
+        """Count the lines words wrap into, measuring each word only once.
+
+        Line widths are accumulated in integer glyph units and converted exactly
+        the way FPDF.get_string_width does, so wrap decisions are identical to
+        re-measuring the growing line, without the quadratic cost. Glyph units
+        do not depend on the font size, so each font file keeps a table of the
+        words already measured, shared by every generator in the process; the
+        vocabulary of a batch of papers is only summed once.
+        """
+        font = self.current_font
+        char_widths = font.cw
+        font_file = str(font.ttffile)
+        word_units_table = self._word_units_cache.get(font_file)
+        if word_units_table is None:
+            word_units_table = self._word_units_cache[font_file] = {}
+        font_size_pt = self.font_size_pt
+        k = self.k
+        max_words = self.WORD_UNITS_CACHE_SIZE
+        space_units = char_widths[32]
         lines = 1
-        current_line = ''
+        line_units = None
         
         for word in words:
-            test_line = current_line + ' ' + word if current_line else word
-            if self.get_string_width(test_line) > width:
+            word_units = word_units_table.get(word)
+            if word_units is None:
+                word_units = sum(char_widths[ord(c)] for c in word)
+                if len(word_units_table) >= max_words:
+                    del word_units_table[next(iter(word_units_table))]
+                word_units_table[word] = word_units
+            test_units = word_units if line_units is None else line_units + space_units + word_units
+            if test_units * font_size_pt * 0.001 / k > width:
                 lines += 1
-                current_line = word
+                line_units = word_units
             else:
-                current_line = test_line
+                line_units = test_units
         
-        return lines * self.config.spacing['line_height']
+        return lines
+
+    def _measure_section(self, section_name: str, description: str) -> Tuple[float, float]:
+        """Return the raw (name, description) text heights of a section header.
+
+        Results are cached at class level so that every paper set sharing the
+        same sections only measures each header once. Estimates are measured in
+        the regular Noto face, so its file and whether it loaded are part of the key.
+        """
+        section_name_font_size = self.config.font_sizes['section_name']
+        section_description_font_size = self.config.font_sizes['section_description']
+        description_width = self._column_width - self._question_number_width - 1
+        cache_key = (section_name, description, section_name_font_size, section_description_font_size,
+                     round(self._column_width, 2), round(description_width, 2),
+                     self._line_height,
+                     self.config.font_paths.get('Noto', {}).get(''), 'noto' in self.fonts)
+
+        cache = self._section_measure_cache
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        self.set_font('Noto', 'B', section_name_font_size)
+        section_name_height = self.estimate_text_height(section_name, self._column_width, section_name_font_size)
+
+        self.set_font('Noto', 'I', section_description_font_size)
+        description_height = self.estimate_text_height(description, description_width, section_description_font_size)
+
+        result = (section_name_height, description_height)
+        if len(cache) >= self.SECTION_MEASURE_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[cache_key] = result
+        return result
 
     def add_section(self, section_name: str, description: str, next_question_height: float) -> None:
         """Add a new section header with description within the current column."""
-        x_start = 10 if self.current_side == 'left' else self.w/2 + 2
+        x_start = 10 if self.current_side == 'left' else self._right_column_x
         
         # Get font sizes from configuration
         section_name_font_size = self.config.font_sizes['section_name']
         section_description_font_size = self.config.font_sizes['section_description']
         
-        # Calculate needed height for section header more precisely
-        self.set_font('Noto', 'B', section_name_font_size)
-        section_name_height = self.estimate_text_height(section_name, self._column_width, section_name_font_size)
+        # Calculate needed height for section header (cached across sets)
+        section_name_height, description_height = self._measure_section(section_name, description)
         
         # Add spacing after section name
         section_name_height += self.config.spacing['section_spacing']['after_section_name']
         
-        # Calculate description height
-        self.set_font('Noto', 'I', section_description_font_size)
-        description_width = self._column_width - self.config.spacing['question_number_width'] - 1
-        description_height = self.estimate_text_height(description, description_width, section_description_font_size)
-        
         # Add spacing after description
         description_height += self.config.spacing['section_spacing']['after_description']
         
@@ -212,7 +396,7 @@ class BasePaperGenerator(FPDF):
         effective_page_height = self.h - footer_buffer
         
         # Add extra spacing if not at top of column
-        if current_y > (self.first_page_offset + 5 if self.page_no() == 1 else 20):
+        if current_y > self._column_top:
             spacing_before = self.config.spacing['section_spacing']['before_section']
             current_y += spacing_before
         
@@ -221,7 +405,7 @@ class BasePaperGenerator(FPDF):
             if self.current_side == 'left':
                 # Not enough space for section + question, try right column
                 self.current_side = 'right'
-                right_column_start = self.first_page_offset + 5 if self.page_no() == 1 else 20
+                right_column_start = self._column_top
                 
                 if (right_column_start + total_needed_height) > effective_page_height:
                     # Not enough space in right column either, go to next page
@@ -230,7 +414,7 @@ class BasePaperGenerator(FPDF):
                     self.set_xy(10, 20)
                 else:
                     # Move to right column
-                    self.set_xy(self.w/2 + 2, right_column_start)
+                    self.set_xy(self._right_column_x, right_column_start)
             else:
                 # Not enough space in right column, go to next page
                 self.add_page()
@@ -238,67 +422,145 @@ class BasePaperGenerator(FPDF):
                 self.set_xy(10, 20)
         else:
             # There is enough space, add spacing if not at top of column
-            if current_y > (self.first_page_offset + 5 if self.page_no() == 1 else 20):
+            if current_y > self._column_top:
                 self.ln(self.config.spacing['section_spacing']['before_section'])
         
-        x_start = 10 if self.current_side == 'left' else self.w/2 + 2
+        x_start = 10 if self.current_side == 'left' else self._right_column_x
         current_y = self.get_y()
         
         # Section name in bold and centered
         self.set_font('Noto', 'B', section_name_font_size)
         self.set_xy(x_start, current_y)
-        self.multi_cell(self._column_width, self.config.spacing['line_height'], section_name, 0, 'C')
+        self.multi_cell(self._column_width, self._line_height, section_name, 0, 'C')
         
         # Space after section name
         self.ln(self.config.spacing['section_spacing']['after_section_name'])
         
         # Section description/instructions in italic and left-aligned
-        description_x = x_start + self.config.spacing['question_number_width'] + 1
-        description_width = self._column_width - self.config.spacing['question_number_width'] - 1
+        description_x = x_start + self._question_number_width + 1
+        description_width = self._column_width - self._question_number_width - 1
         
         self.set_font('Noto', 'I', section_description_font_size)
         self.set_xy(description_x, self.get_y())
-        self.multi_cell(description_width, self.config.spacing['line_height'], description, 0, 'L')
+        self.multi_cell(description_width, self._line_height, description, 0, 'L')
         
         # Space after description
         self.ln(self.config.spacing['section_spacing']['after_description'])
 
     def footer(self) -> None:
         """Draw page footer with page number."""
-        self.line(10, self.h - self.footer_buffer, self.w - 10, self.h - self.footer_buffer)
+        self.line(10, self._effective_page_height, self.w - 10, self._effective_page_height)
         self.set_y(-10)
         self.set_font('Noto', 'I', self.config.font_sizes['footer'])
         self.cell(0, 5, f'Page {self.page_no()}', 0, 0, 'C')
 
     def measure_option_width(self, option_text: str) -> float:
-        """Measure the width of an option including its label."""
-        self.set_font('ArialUni', '', self.config.font_sizes['option'])
-        return self.get_string_width(f"A. {option_text}")
+        """Measure the width of an option including its label.
+
+        Widths are cached, so options repeated across questions ("All of the
+        above", "True", ...) are only measured once.
+        """
+        return self.get_cached_string_width(
+            f"A. {option_text}",
+            'ArialUni',
+            '',
+            self._option_font_size
+        )
 
     def can_fit_two_options(self, option1: str, option2: str) -> bool:
         """Check if two options can fit side by side."""
         width1 = self.measure_option_width(option1)
         width2 = self.measure_option_width(option2)
-        total_width = width1 + width2 + self.config.spacing['option_column_gap']
+        total_width = width1 + width2 + self._option_column_gap
         return total_width <= self._options_width
 
+    def _choice_rows(self, choices: List[str]) -> Tuple[Tuple[int, bool], ...]:
+        """Return (first index, paired) for each row of choices.
+
+        Adjacent options share a row when they fit side by side. The result is
+        memoized so the measuring and rendering passes share one set of width checks.
+        """
+        key = tuple(choices)
+        rows = self._choice_rows_cache.get(key)
+        if rows is None:
+            # Measure every option once, then decide the pairs from the widths
+            # (the same test as can_fit_two_options)
+            widths = [self.measure_option_width(choice) for choice in choices]
+            gap = self._option_column_gap
+            options_width = self._options_width
+            row_list = []
+            last = len(choices) - 1
+            indices = iter(range(len(choices)))
+            for i in indices:
+                if i < last and widths[i] + widths[i+1] + gap <= options_width:
+                    row_list.append((i, True))
+                    next(indices)  # The partner option is consumed by this row
+                else:
+                    row_list.append((i, False))
+            rows = tuple(row_list)
+            self._choice_rows_cache[key] = rows
+        return rows
+    
+    def _move_to_next_position(self):
+        """Move to next column or page when current position has insufficient space."""
+        if self.current_side == 'left':
+            # Try right column
+            right_column_start = self._column_top
+            self.current_side = 'right'
+            self.set_xy(self._right_column_x, right_column_start)
+        else:
+            # Already on right side, start new page
+            self.add_page()
+            self.current_side = 'left'
+            self.set_xy(10, 20)
+
+    def _advance_to_fit(self, total_needed_height: float) -> Tuple[float, float]:
+        """Move to the next column or page if a block of the given height does not fit.
+
+        The placement is decided once: a block taller than a whole column is
+        rendered at the top of a fresh page instead of being retried forever.
+        Returns the (x, y) position at which the block should be written.
+        """
+        effective_page_height = self._effective_page_height
+        available_space = effective_page_height - self.get_y()
+
+        if total_needed_height > available_space:
+            if self.current_side == 'left':
+                right_column_start = self._column_top
+                right_available_space = effective_page_height - right_column_start
+
+                if total_needed_height <= right_available_space:
+                    self.current_side = 'right'
+                    self.set_xy(self._right_column_x, right_column_start)
+                else:
+                    self.add_page()
+                    self.current_side = 'left'
+                    self.set_xy(10, 20)
+            else:
+                self.add_page()
+                self.current_side = 'left'
+                self.set_xy(10, 20)
+
+        x_start = 10 if self.current_side == 'left' else self._right_column_x
+        return x_start, self.get_y()
+
     def write_option(self, label: str, option_text: str, x: float, y: float, 
                     width: float, is_answer: bool = False) -> float:
         """Write a single option and return its height. Returns -1 if option doesn't fit."""
         # Calculate the height needed for this option
         if is_answer and self.show_answers:
-            self.set_font('ArialUni', 'B', self.config.font_sizes['option'])
+            self.set_font('ArialUni', 'B', self._option_font_size)
             option_text_to_measure = option_text + " *"
         else:
-            self.set_font('ArialUni', '', self.config.font_sizes['option'])
+            self.set_font('ArialUni', '', self._option_font_size)
             option_text_to_measure = option_text
         
         # Estimate the height needed for this option
-        option_height = self.estimate_text_height(option_text_to_measure, width - 5 + 1, self.config.font_sizes['option'])
+        option_height = self.estimate_text_height(option_text_to_measure, width - 5 + 1, self._option_font_size)
 
         # Check if there's enough space on the current page
         current_y = y
-        effective_page_height = self.h - self.footer_buffer
+        effective_page_height = self._effective_page_height
         
         # If option won't fit in remaining space, return -1
         if (current_y + option_height) > effective_page_height:
@@ -307,15 +569,15 @@ class BasePaperGenerator(FPDF):
         # If we have enough space, write the option
         self.set_xy(x, y)
         label_width = 5
-        self.set_font('Noto', 'B', self.config.font_sizes['option_label'])
+        self.set_font('Noto', 'B', self._option_label_font_size)
         self.cell(label_width, 5, label, 0, 0)
         
         self.set_xy(x + label_width, y)
         if is_answer and self.show_answers:
-            self.set_font('ArialUni', 'B', self.config.font_sizes['option'])
+            self.set_font('ArialUni', 'B', self._option_font_size)
             option_text = option_text + " *"
         else:
-            self.set_font('ArialUni', '', self.config.font_sizes['option'])
+            self.set_font('ArialUni', '', self._option_font_size)
         self.multi_cell(width - label_width + 1, 5, option_text, align='L')
         return self.get_y() - y
 
@@ -325,7 +587,7 @@ class BasePaperGenerator(FPDF):
         if start_idx >= len(options):
             return 0
 
-        half_width = (width - self.config.spacing['option_column_gap']) / 2
+        half_width = (width - self._option_column_gap) / 2
         label1, text1, is_answer1 = options[start_idx]
         height1 = self.write_option(label1, text1, x, y, half_width, is_answer1)
         
@@ -336,7 +598,7 @@ class BasePaperGenerator(FPDF):
         height2 = 0
         if start_idx + 1 < len(options):
             label2, text2, is_answer2 = options[start_idx + 1]
-            x2 = x + half_width + self.config.spacing['option_column_gap']
+            x2 = x + half_width + self._option_column_gap
             height2 = self.write_option(label2, text2, x2, y, half_width, is_answer2)
             
             # If second option doesn't fit, return -1
@@ -351,34 +613,25 @@ class BasePaperGenerator(FPDF):
         This is used at the end of question papers to indicate the end of the questions.
         """
         # Calculate size-aware end marker height
-        line_height = self.config.spacing['line_height']
+        line_height = self._line_height
         vertical_spacing = 2 * line_height  # Spacing before and after
         text_row_height = line_height  # Height of the text row
         end_marker_height = vertical_spacing + text_row_height + vertical_spacing
 
         # Check if there's enough space for the end marker in the current column
         y_pos = self.get_y()
-        effective_page_height = self.h - self.footer_buffer
+        effective_page_height = self._effective_page_height
 
         # If there's not enough space in the current column for the end marker
         if (y_pos + end_marker_height) > effective_page_height:
             # Move to the next column or page
-            if self.current_side == 'left':
-                # Try right column
-                right_column_start = self.first_page_offset + 5 if self.page_no() == 1 else 20
-                self.current_side = 'right'
-                self.set_xy(self.w/2 + 2, right_column_start)
-            else:
-                # If we're already on right side, create new page
-                self.add_page()
-                self.current_side = 'left'
-                self.set_xy(10, 20)
+            self._move_to_next_position()
         
         # Determine which column we're in and use full column width (including question number area)
         if self.current_side == 'left':
             x_start = 10
         else:
-            x_start = self.w/2 + 2
+            x_start = self._right_column_x
         # Use full column width
         available_width = self._column_width
 
@@ -1,5 +1,7 @@
-from typing import List, Dict, Optional, Tuple
+from itertools import islice, zip_longest
+from typing import Callable, List, Dict, Optional, Tuple
 from .mcq_generator import MCQPaperGenerator, MCQConfig, SectionConfig
+from .base_generator import _CHOICE_LABELS
 from .styles import PaperStyles
 
 class EnhancedMCQPaperGenerator(MCQPaperGenerator):
@@ -7,47 +9,54 @@ class EnhancedMCQPaperGenerator(MCQPaperGenerator):
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._choices_height_cache: Dict[Tuple[str, ...], float] = {}
+        
+        # (measure, render) handlers for the special question_text segments;
+        # any other segment is regular question text
+        statement_handlers = (self._measure_statement_segment, self._render_statement_segment)
+        self._segment_handlers = {
+            'STATEMENT': statement_handlers,
+            'STATEMENTS': statement_handlers,
+            'LIST': (self._measure_list_segment, self._render_list_segment),
+            'MTF_DATA': (self._measure_mtf_segment, self._render_mtf_segment),
+            'PARAGRAPH': (self._measure_paragraph_segment, self._render_paragraph_segment),
+        }
     
     def _get_question_text(self, question: Dict, fallback_key: str = 'question') -> List[str]:
         """Extract question_text as array, handling both string and array formats."""
-        question_text = question.get('question_text', question.get(fallback_key, ''))
+        if 'question_text' in question:
+            question_text = question['question_text']
+        else:
+            question_text = question.get(fallback_key, '')
         
-        if isinstance(question_text, list):
+        # JSON input only ever yields exact list/str instances
+        question_type = type(question_text)
+        if question_type is list:
             return question_text
-        elif isinstance(question_text, str):
-            return [question_text] if question_text else ['']
+        elif question_type is str:
+            return [question_text]
         else:
             return ['']
     
     def measure_question_height(self, question_text, choices: List[str], reasoning: Optional[str] = None) -> float:
         """Override to handle question_text arrays."""
         if isinstance(question_text, list):
-            # Calculate total height for all question text segments
-            total_question_height = 0
-            for text in question_text:
-                if text.strip():  # Only measure non-empty text
-                    text_height = self.estimate_text_height(
-                        text, self._question_width, self.config.font_sizes['question']
-                    )
-                    total_question_height += text_height + 2  # Add spacing between segments
+            estimate = self.estimate_text_height
 
-            # Use actual render width for choices (accounting for label)
-            label_adjustment = 4
-            single_option_render_width = self._options_width - label_adjustment
+            # Calculate total height for all non-blank question text segments
+            question_width = self._question_width
+            question_font_size = self._question_font_size
+            total_question_height = sum(
+                estimate(text, question_width, question_font_size) + 2  # Add spacing between segments
+                for text in question_text if text and not text.isspace()
+            )
 
-            # Calculate choices height using proper width
-            choices_height = 0
-            for choice in choices:
-                choice_height = self.estimate_text_height(
-                    choice, single_option_render_width, self.config.font_sizes['option']
-                )
-                choices_height += choice_height
+            # Calculate choices height using the actual render width (accounting for label)
+            option_width = self._single_option_render_width
+            option_font_size = self._option_font_size
+            choices_height = sum(estimate(choice, option_width, option_font_size) for choice in choices)
 
-            reasoning_height = 0
-            if reasoning and self.show_answers:
-                reasoning_height = self.estimate_text_height(
-                    reasoning, single_option_render_width, self.config.font_sizes['option']
-                ) + 7
+            reasoning_height = self._measure_reasoning_height(reasoning)
 
             return total_question_height + choices_height + reasoning_height + 5
         else:
@@ -67,7 +76,7 @@ class EnhancedMCQPaperGenerator(MCQPaperGenerator):
         current_y = y
         
         # Set font for table content (same for headers and data)
-        self.set_font('ArialUni', '', self.config.font_sizes['option'])
+        self.set_font('ArialUni', '', self._option_font_size)
         
         # Prepare data including headers as first row if they exist
         left_data = []
@@ -82,51 +91,40 @@ class EnhancedMCQPaperGenerator(MCQPaperGenerator):
         left_data.extend(left_column)
         right_data.extend(right_column)
         
-        max_items = max(len(left_data), len(right_data))
+        has_header = bool(left_header or right_header)
+        line_height = self._line_height
+        dash_x = x + left_width
+        right_x = dash_x + dash_width
         
-        # Render each row (including headers as first row)
-        for i in range(max_items):
+        # Render each row (including headers as first row); the shorter column
+        # is padded with None so a genuinely empty item still takes its line
+        for i, (left_text, right_text) in enumerate(zip_longest(left_data, right_data)):
             row_start_y = current_y
             left_end_y = row_start_y
             right_end_y = row_start_y
             
-            # Determine if this is the header row (first row and headers exist)
-            is_header_row = (i == 0 and (left_header or right_header))
-            
-            # Set font based on whether this is a header row
-            if is_header_row:
-                # Use statement label styling for headers
-                self.set_font('ArialUni', 'B', self.config.font_sizes['option_label'])
-            else:
-                # Use regular data font
-                self.set_font('ArialUni', '', self.config.font_sizes['option'])
+            # Headers use statement label styling; switch back to the regular
+            # data font once, after the header row
+            if has_header and i == 0:
+                self.set_font('ArialUni', 'B', self._option_label_font_size)
+            elif has_header and i == 1:
+                self.set_font('ArialUni', '', self._option_font_size)
             
             # Left column item
-            if i < len(left_data):
+            if left_text is not None:
                 self.set_xy(x, current_y)
-                left_text = left_data[i]
-                
-                # Write left column text and track actual end position
-                self.multi_cell(left_width, self.config.spacing['line_height'], 
-                              left_text, align='L')
+                self.multi_cell(left_width, line_height, left_text, align='L')
                 left_end_y = self.get_y()
             
             # Right column item - render at same starting Y as left column
-            if i < len(right_data):
-                self.set_xy(x + left_width + dash_width, row_start_y)
-                right_text = right_data[i]
-                
-                # Write right column text and track actual end position
-                self.multi_cell(right_width, self.config.spacing['line_height'], 
-                              right_text, align='L')
+            if right_text is not None:
+                self.set_xy(right_x, row_start_y)
+                self.multi_cell(right_width, line_height, right_text, align='L')
                 right_end_y = self.get_y()
             
-            # Calculate actual row height based on which column went further
-            actual_row_height = max(left_end_y, right_end_y) - row_start_y
-            
             # Position dash separator aligned with the text baseline of the first line
             dash_y = row_start_y - 0.5 # Align with text baseline (small offset for visual alignment)
-            self.set_xy(x + left_width, dash_y)
+            self.set_xy(dash_x, dash_y)
             self.cell(dash_width, 5, '-', 0, 0, 'C')
             
             # Move to next row based on actual heights
@@ -134,576 +132,163 @@ class EnhancedMCQPaperGenerator(MCQPaperGenerator):
         
         return current_y - y
     
-    def add_statement_question(self, number: int, question_text: str, statement: str,
-                              choices: List[str], correct_answer_index: Optional[int] = None,
-                              reasoning: Optional[str] = None) -> None:
-        """Add a Statement Based MCQ question."""
-        
-        # Calculate height needed for the entire question
-        needed_height = self.measure_statement_question_height(
-            question_text, statement, choices, reasoning
-        )
-        
+    def _render_question(self, number: int, question_text: str, needed_height: float,
+                         render_body: Callable[..., float], body_args: Tuple,
+                         choices: List[str], correct_answer_index: Optional[int],
+                         reasoning: Optional[str], single_column_choices: bool = False) -> None:
+        """Lay out a typed question around the block between its text and its choices.
+
+        ``render_body(question_x, y, *body_args)`` draws that block starting at
+        ``y`` and returns the y position at which the choices begin.
+        """
         safety_buffer = 3
         total_needed_height = needed_height + safety_buffer
         
-        # Check if we need to move to next column/page
-        current_y = self.get_y()
-        footer_buffer = self.footer_buffer
-        effective_page_height = self.h - footer_buffer
-        available_space = effective_page_height - current_y
-        
-        if total_needed_height > available_space:
-            if self.current_side == 'left':
-                right_column_start = self.first_page_offset + 5 if self.page_no() == 1 else 20
-                right_available_space = effective_page_height - right_column_start
-                
-                if total_needed_height <= right_available_space:
-                    self.current_side = 'right'
-                    self.set_xy(self.w/2 + 2, right_column_start)
-                else:
-                    self.add_page()
-                    self.current_side = 'left'
-                    self.set_xy(10, 20)
-            else:
-                self.add_page()
-                self.current_side = 'left'
-                self.set_xy(10, 20)
-            
-            return self.add_statement_question(number, question_text, statement, 
-                                             choices, correct_answer_index, reasoning)
-        
-        # Now write the question
-        x_start = 10 if self.current_side == 'left' else self.w/2 + 2
-        start_y = self.get_y()
+        # Move to the next column/page if the question does not fit here
+        x_start, start_y = self._advance_to_fit(total_needed_height)
         
         # Write question number and text
-        self.set_font('Noto', 'B', self.config.font_sizes['question_number'])
-        self.set_xy(x_start, start_y)
-        self.cell(self.config.spacing['question_number_width'], 5, f"{number}.", 0, 0, 'R')
+        question_x = self._write_question_header(number, question_text, x_start, start_y)
         
-        question_x = x_start + self.config.spacing['question_number_width'] + 1
-        self.set_xy(question_x, start_y)
-        self.set_font('ArialUni', 'I', self.config.font_sizes['question'])
-        self.multi_cell(self._question_width, self.config.spacing['line_height'], question_text)
+        # Render the type-specific block after some spacing
+        current_y = render_body(question_x, self.get_y() + 2, *body_args)
         
-        # Add spacing before statement
-        current_y = self.get_y() + 2
+        options_x = question_x + 2
+        if single_column_choices:
+            current_y = self._render_single_column_choices(choices, options_x, current_y, correct_answer_index)
+        else:
+            current_y = self._render_choices(choices, options_x, current_y, correct_answer_index)
+        
+        # Add reasoning if needed
+        if reasoning and self.show_answers:
+            current_y = self._render_reasoning(reasoning, options_x, current_y)
         
-        # Render statement in a box/highlighted format
+        # Set final position
+        self.set_y(current_y + 1)
+    
+    def _render_single_column_choices(self, choices: List[str], x: float, y: float,
+                                      correct_answer_index: Optional[int]) -> float:
+        """Render choices one per row at full width and return new Y position."""
+        current_y = y
+        options_width = self._options_width
+        write = self._write_single_option
+        for i, choice in enumerate(choices):
+            option_height = write(
+                _CHOICE_LABELS[i], choice, x, current_y, options_width, i == correct_answer_index
+            )
+            current_y += option_height + 1
+        return current_y
+    
+    def _render_statement_block(self, question_x: float, y: float, statement: str) -> float:
+        """Render a labelled statement and return the Y position for the choices."""
         statement_x = question_x + 5
-        self.set_xy(statement_x, current_y)
-        self.set_font('ArialUni', 'B', self.config.font_sizes['option'])
+        self.set_xy(statement_x, y)
+        self.set_font('ArialUni', 'B', self._option_font_size)
         self.cell(10, 5, "Statement:", 0, 0)
         
-        current_y += 6
-        self.set_xy(statement_x, current_y)
-        self.set_font('ArialUni', '', self.config.font_sizes['option'])
-        self.multi_cell(self._question_width - 5, self.config.spacing['line_height'], statement)
+        self.set_xy(statement_x, y + 6)
+        self.set_font('ArialUni', '', self._option_font_size)
+        self.multi_cell(self._indented_width, self._line_height, statement)
         
         # Add spacing before options
-        current_y = self.get_y() + 3
+        return self.get_y() + 3
+    
+    def _render_item_block(self, question_x: float, y: float, items: List[str]) -> float:
+        """Render indented statements or sequence items and return the Y position for the choices."""
+        current_y = y
+        items_x = question_x + 5
+        item_width = self._indented_width
+        line_height = self._line_height
+        self.set_font('ArialUni', '', self._option_font_size)
+        for item in items:
+            self.set_xy(items_x, current_y)
+            self.multi_cell(item_width, line_height, item)
+            current_y = self.get_y() + 1
         
-        # Write choices using existing logic
-        options_x = question_x + 2
-        i = 0
-        
-        while i < len(choices):
-            if (i + 1 < len(choices) and 
-                self.can_fit_two_options(choices[i], choices[i+1])):
-                # Write two options side by side
-                half_width = (self._options_width - self.config.spacing['option_column_gap']) / 2
-                
-                label1 = f"{chr(65+i)}."
-                is_answer1 = (i == correct_answer_index)
-                option_height1 = self._write_single_option(
-                    label1, choices[i], options_x, current_y, half_width, is_answer1
-                )
-                
-                label2 = f"{chr(65+i+1)}."
-                is_answer2 = (i+1 == correct_answer_index)
-                x2 = options_x + half_width + self.config.spacing['option_column_gap']
-                option_height2 = self._write_single_option(
-                    label2, choices[i+1], x2, current_y, half_width, is_answer2
-                )
-                
-                current_y += max(option_height1, option_height2) + 1
-                i += 2
-            else:
-                # Write single option
-                label = f"{chr(65+i)}."
-                is_answer = (i == correct_answer_index)
-                option_height = self._write_single_option(
-                    label, choices[i], options_x, current_y, self._options_width, is_answer
-                )
-                current_y += option_height + 1
-                i += 1
+        # Add spacing before options
+        return current_y + 2
+    
+    def _render_paragraph_block(self, question_x: float, y: float, paragraph: str,
+                                question_text_after: str) -> float:
+        """Render a paragraph and the question that follows it, and return the Y position for the choices."""
+        self.set_xy(question_x + 5, y)
+        self.set_font('ArialUni', '', self._option_font_size)
+        self.multi_cell(self._indented_width, self._line_height, paragraph)
         
-        # Add reasoning if needed
-        if reasoning and self.show_answers:
-            current_y += 1
-            self.set_xy(options_x, current_y)
-            self.set_font('Noto', 'B', self.config.font_sizes['option_label'])
-            self.cell(30, 5, "Explanation:", 0, 0)
-            
-            self.set_xy(options_x, current_y + 5)
-            self.set_font('ArialUni', '', self.config.font_sizes['option'])
-            self.multi_cell(self._options_width, self.config.spacing['line_height'], reasoning)
-            current_y = self.get_y() + 2
+        # Add spacing and question text after paragraph
+        self.set_xy(question_x, self.get_y() + 2)
+        self.set_font('ArialUni', 'I', self._question_font_size)
+        self.multi_cell(self._question_width, self._line_height, question_text_after)
         
-        # Set final position
-        self.set_y(current_y + 1)
+        # Add spacing before options
+        return self.get_y() + 2
+    
+    def _render_mtf_block(self, question_x: float, y: float, left_column: List[str],
+                          right_column: List[str]) -> float:
+        """Render an MTF table and return the Y position for the choices."""
+        table_width = self._indented_width  # Only left indent, no right gap
+        table_x = question_x + 5  # Indent the table slightly
+        
+        mtf_height = self.render_mtf_table(left_column, right_column, table_x, y, table_width)
+        return y + mtf_height + 3
+    
+    def add_statement_question(self, number: int, question_text: str, statement: str,
+                              choices: List[str], correct_answer_index: Optional[int] = None,
+                              reasoning: Optional[str] = None) -> None:
+        """Add a Statement Based MCQ question."""
+        needed_height = self.measure_statement_question_height(
+            question_text, statement, choices, reasoning
+        )
+        self._render_question(number, question_text, needed_height,
+                              self._render_statement_block, (statement,),
+                              choices, correct_answer_index, reasoning)
     
     def add_multiple_statement_question(self, number: int, question_text: str, statements: List[str],
                                       choices: List[str], correct_answer_index: Optional[int] = None,
                                       reasoning: Optional[str] = None) -> None:
         """Add a Multiple Statement MCQ question."""
-        
-        # Calculate height needed for the entire question
         needed_height = self.measure_multiple_statement_question_height(
             question_text, statements, choices, reasoning
         )
-        
-        safety_buffer = 3
-        total_needed_height = needed_height + safety_buffer
-        
-        # Check if we need to move to next column/page
-        current_y = self.get_y()
-        footer_buffer = self.footer_buffer
-        effective_page_height = self.h - footer_buffer
-        available_space = effective_page_height - current_y
-        
-        if total_needed_height > available_space:
-            if self.current_side == 'left':
-                right_column_start = self.first_page_offset + 5 if self.page_no() == 1 else 20
-                right_available_space = effective_page_height - right_column_start
-                
-                if total_needed_height <= right_available_space:
-                    self.current_side = 'right'
-                    self.set_xy(self.w/2 + 2, right_column_start)
-                else:
-                    self.add_page()
-                    self.current_side = 'left'
-                    self.set_xy(10, 20)
-            else:
-                self.add_page()
-                self.current_side = 'left'
-                self.set_xy(10, 20)
-            
-            return self.add_multiple_statement_question(number, question_text, statements, 
-                                                      choices, correct_answer_index, reasoning)
-        
-        # Now write the question
-        x_start = 10 if self.current_side == 'left' else self.w/2 + 2
-        start_y = self.get_y()
-        
-        # Write question number and text
-        self.set_font('Noto', 'B', self.config.font_sizes['question_number'])
-        self.set_xy(x_start, start_y)
-        self.cell(self.config.spacing['question_number_width'], 5, f"{number}.", 0, 0, 'R')
-        
-        question_x = x_start + self.config.spacing['question_number_width'] + 1
-        self.set_xy(question_x, start_y)
-        self.set_font('ArialUni', 'I', self.config.font_sizes['question'])
-        self.multi_cell(self._question_width, self.config.spacing['line_height'], question_text)
-        
-        # Add spacing before statements
-        current_y = self.get_y() + 2
-        
-        # Render statements
-        statements_x = question_x + 5
-        for statement in statements:
-            self.set_xy(statements_x, current_y)
-            self.set_font('ArialUni', '', self.config.font_sizes['option'])
-            self.multi_cell(self._question_width - 5, self.config.spacing['line_height'], statement)
-            current_y = self.get_y() + 1
-        
-        # Add spacing before options
-        current_y += 2
-        
-        # Write choices using existing logic
-        options_x = question_x + 2
-        i = 0
-        
-        while i < len(choices):
-            if (i + 1 < len(choices) and 
-                self.can_fit_two_options(choices[i], choices[i+1])):
-                # Write two options side by side
-                half_width = (self._options_width - self.config.spacing['option_column_gap']) / 2
-                
-                label1 = f"{chr(65+i)}."
-                is_answer1 = (i == correct_answer_index)
-                option_height1 = self._write_single_option(
-                    label1, choices[i], options_x, current_y, half_width, is_answer1
-                )
-                
-                label2 = f"{chr(65+i+1)}."
-                is_answer2 = (i+1 == correct_answer_index)
-                x2 = options_x + half_width + self.config.spacing['option_column_gap']
-                option_height2 = self._write_single_option(
-                    label2, choices[i+1], x2, current_y, half_width, is_answer2
-                )
-                
-                current_y += max(option_height1, option_height2) + 1
-                i += 2
-            else:
-                # Write single option
-                label = f"{chr(65+i)}."
-                is_answer = (i == correct_answer_index)
-                option_height = self._write_single_option(
-                    label, choices[i], options_x, current_y, self._options_width, is_answer
-                )
-                current_y += option_height + 1
-                i += 1
-        
-        # Add reasoning if needed
-        if reasoning and self.show_answers:
-            current_y += 1
-            self.set_xy(options_x, current_y)
-            self.set_font('Noto', 'B', self.config.font_sizes['option_label'])
-            self.cell(30, 5, "Explanation:", 0, 0)
-            
-            self.set_xy(options_x, current_y + 5)
-            self.set_font('ArialUni', '', self.config.font_sizes['option'])
-            self.multi_cell(self._options_width, self.config.spacing['line_height'], reasoning)
-            current_y = self.get_y() + 2
-        
-        # Set final position
-        self.set_y(current_y + 1)
+        self._render_question(number, question_text, needed_height,
+                              self._render_item_block, (statements,),
+                              choices, correct_answer_index, reasoning)
     
     def add_sequencing_question(self, number: int, question_text: str, sequence_items: List[str],
                                choices: List[str], correct_answer_index: Optional[int] = None,
                                reasoning: Optional[str] = None) -> None:
         """Add a Sequencing MCQ question."""
-        
-        # Calculate height needed for the entire question
         needed_height = self.measure_sequencing_question_height(
             question_text, sequence_items, choices, reasoning
         )
-        
-        safety_buffer = 3
-        total_needed_height = needed_height + safety_buffer
-        
-        # Check if we need to move to next column/page
-        current_y = self.get_y()
-        footer_buffer = self.footer_buffer
-        effective_page_height = self.h - footer_buffer
-        available_space = effective_page_height - current_y
-        
-        if total_needed_height > available_space:
-            if self.current_side == 'left':
-                right_column_start = self.first_page_offset + 5 if self.page_no() == 1 else 20
-                right_available_space = effective_page_height - right_column_start
-                
-                if total_needed_height <= right_available_space:
-                    self.current_side = 'right'
-                    self.set_xy(self.w/2 + 2, right_column_start)
-                else:
-                    self.add_page()
-                    self.current_side = 'left'
-                    self.set_xy(10, 20)
-            else:
-                self.add_page()
-                self.current_side = 'left'
-                self.set_xy(10, 20)
-            
-            return self.add_sequencing_question(number, question_text, sequence_items, 
-                                              choices, correct_answer_index, reasoning)
-        
-        # Now write the question
-        x_start = 10 if self.current_side == 'left' else self.w/2 + 2
-        start_y = self.get_y()
-        
-        # Write question number and text
-        self.set_font('Noto', 'B', self.config.font_sizes['question_number'])
-        self.set_xy(x_start, start_y)
-        self.cell(self.config.spacing['question_number_width'], 5, f"{number}.", 0, 0, 'R')
-        
-        question_x = x_start + self.config.spacing['question_number_width'] + 1
-        self.set_xy(question_x, start_y)
-        self.set_font('ArialUni', 'I', self.config.font_sizes['question'])
-        self.multi_cell(self._question_width, self.config.spacing['line_height'], question_text)
-        
-        # Add spacing before sequence items
-        current_y = self.get_y() + 2
-        
-        # Render sequence items in a box
-        items_x = question_x + 5
-        for item in sequence_items:
-            self.set_xy(items_x, current_y)
-            self.set_font('ArialUni', '', self.config.font_sizes['option'])
-            self.multi_cell(self._question_width - 5, self.config.spacing['line_height'], item)
-            current_y = self.get_y() + 1
-        
-        # Add spacing before options
-        current_y += 2
-        
-        # Write choices using existing logic
-        options_x = question_x + 2
-        i = 0
-        
-        while i < len(choices):
-            # For sequencing questions, options are usually long, so prefer single column
-            label = f"{chr(65+i)}."
-            is_answer = (i == correct_answer_index)
-            option_height = self._write_single_option(
-                label, choices[i], options_x, current_y, self._options_width, is_answer
-            )
-            current_y += option_height + 1
-            i += 1
-        
-        # Add reasoning if needed
-        if reasoning and self.show_answers:
-            current_y += 1
-            self.set_xy(options_x, current_y)
-            self.set_font('Noto', 'B', self.config.font_sizes['option_label'])
-            self.cell(30, 5, "Explanation:", 0, 0)
-            
-            self.set_xy(options_x, current_y + 5)
-            self.set_font('ArialUni', '', self.config.font_sizes['option'])
-            self.multi_cell(self._options_width, self.config.spacing['line_height'], reasoning)
-            current_y = self.get_y() + 2
-        
-        # Set final position
-        self.set_y(current_y + 1)
+        # Sequencing options are usually long, so they use a single column
+        self._render_question(number, question_text, needed_height,
+                              self._render_item_block, (sequence_items,),
+                              choices, correct_answer_index, reasoning,
+                              single_column_choices=True)
     
     def add_paragraph_question(self, number: int, question_text: str, paragraph: str, question_text_after: str,
                               choices: List[str], correct_answer_index: Optional[int] = None,
                               reasoning: Optional[str] = None) -> None:
         """Add a Paragraph Based MCQ question."""
-        
-        # Calculate height needed for the entire question
         needed_height = self.measure_paragraph_question_height(
             question_text, paragraph, question_text_after, choices, reasoning
         )
-        
-        safety_buffer = 3
-        total_needed_height = needed_height + safety_buffer
-        
-        # Check if we need to move to next column/page
-        current_y = self.get_y()
-        footer_buffer = self.footer_buffer
-        effective_page_height = self.h - footer_buffer
-        available_space = effective_page_height - current_y
-        
-        if total_needed_height > available_space:
-            if self.current_side == 'left':
-                right_column_start = self.first_page_offset + 5 if self.page_no() == 1 else 20
-                right_available_space = effective_page_height - right_column_start
-                
-                if total_needed_height <= right_available_space:
-                    self.current_side = 'right'
-                    self.set_xy(self.w/2 + 2, right_column_start)
-                else:
-                    self.add_page()
-                    self.current_side = 'left'
-                    self.set_xy(10, 20)
-            else:
-                self.add_page()
-                self.current_side = 'left'
-                self.set_xy(10, 20)
-            
-            return self.add_paragraph_question(number, question_text, paragraph, question_text_after,
-                                             choices, correct_answer_index, reasoning)
-        
-        # Now write the question
-        x_start = 10 if self.current_side == 'left' else self.w/2 + 2
-        start_y = self.get_y()
-        
-        # Write question number and initial text
-        self.set_font('Noto', 'B', self.config.font_sizes['question_number'])
-        self.set_xy(x_start, start_y)
-        self.cell(self.config.spacing['question_number_width'], 5, f"{number}.", 0, 0, 'R')
-        
-        question_x = x_start + self.config.spacing['question_number_width'] + 1
-        self.set_xy(question_x, start_y)
-        self.set_font('ArialUni', 'I', self.config.font_sizes['question'])
-        self.multi_cell(self._question_width, self.config.spacing['line_height'], question_text)
-        
-        # Add spacing before paragraph
-        current_y = self.get_y() + 2
-        
-        # Render paragraph in indented format
-        paragraph_x = question_x + 5
-        self.set_xy(paragraph_x, current_y)
-        self.set_font('ArialUni', '', self.config.font_sizes['option'])
-        self.multi_cell(self._question_width - 5, self.config.spacing['line_height'], paragraph)
-        
-        # Add spacing and question text after paragraph
-        current_y = self.get_y() + 2
-        self.set_xy(question_x, current_y)
-        self.set_font('ArialUni', 'I', self.config.font_sizes['question'])
-        self.multi_cell(self._question_width, self.config.spacing['line_height'], question_text_after)
-        
-        # Add spacing before options
-        current_y = self.get_y() + 2
-        
-        # Write choices using existing logic
-        options_x = question_x + 2
-        i = 0
-        
-        while i < len(choices):
-            if (i + 1 < len(choices) and 
-                self.can_fit_two_options(choices[i], choices[i+1])):
-                # Write two options side by side
-                half_width = (self._options_width - self.config.spacing['option_column_gap']) / 2
-                
-                label1 = f"{chr(65+i)}."
-                is_answer1 = (i == correct_answer_index)
-                option_height1 = self._write_single_option(
-                    label1, choices[i], options_x, current_y, half_width, is_answer1
-                )
-                
-                label2 = f"{chr(65+i+1)}."
-                is_answer2 = (i+1 == correct_answer_index)
-                x2 = options_x + half_width + self.config.spacing['option_column_gap']
-                option_height2 = self._write_single_option(
-                    label2, choices[i+1], x2, current_y, half_width, is_answer2
-                )
-                
-                current_y += max(option_height1, option_height2) + 1
-                i += 2
-            else:
-                # Write single option
-                label = f"{chr(65+i)}."
-                is_answer = (i == correct_answer_index)
-                option_height = self._write_single_option(
-                    label, choices[i], options_x, current_y, self._options_width, is_answer
-                )
-                current_y += option_height + 1
-                i += 1
-        
-        # Add reasoning if needed
-        if reasoning and self.show_answers:
-            current_y += 1
-            self.set_xy(options_x, current_y)
-            self.set_font('Noto', 'B', self.config.font_sizes['option_label'])
-            self.cell(30, 5, "Explanation:", 0, 0)
-            
-            self.set_xy(options_x, current_y + 5)
-            self.set_font('ArialUni', '', self.config.font_sizes['option'])
-            self.multi_cell(self._options_width, self.config.spacing['line_height'], reasoning)
-            current_y = self.get_y() + 2
-        
-        # Set final position
-        self.set_y(current_y + 1)
+        self._render_question(number, question_text, needed_height,
+                              self._render_paragraph_block, (paragraph, question_text_after),
+                              choices, correct_answer_index, reasoning)
     
     def add_mtf_question(self, number: int, question_text: str, 
                         left_column: List[str], right_column: List[str],
                         choices: List[str], correct_answer_index: Optional[int] = None,
                         reasoning: Optional[str] = None) -> None:
         """Add a Match the Following question with proper table formatting."""
-        
-        # Calculate height needed for the entire question
         needed_height = self.measure_mtf_question_height(
             question_text, left_column, right_column, choices, reasoning
         )
-        
-        safety_buffer = 3
-        total_needed_height = needed_height + safety_buffer
-        
-        # Check if we need to move to next column/page
-        current_y = self.get_y()
-        footer_buffer = self.footer_buffer
-        effective_page_height = self.h - footer_buffer
-        available_space = effective_page_height - current_y
-        
-        if total_needed_height > available_space:
-            if self.current_side == 'left':
-                right_column_start = self.first_page_offset + 5 if self.page_no() == 1 else 20
-                right_available_space = effective_page_height - right_column_start
-                
-                if total_needed_height <= right_available_space:
-                    self.current_side = 'right'
-                    self.set_xy(self.w/2 + 2, right_column_start)
-                else:
-                    self.add_page()
-                    self.current_side = 'left'
-                    self.set_xy(10, 20)
-            else:
-                self.add_page()
-                self.current_side = 'left'
-                self.set_xy(10, 20)
-            
-            return self.add_mtf_question(number, question_text, left_column, 
-                                       right_column, choices, correct_answer_index, reasoning)
-        
-        # Now write the question
-        x_start = 10 if self.current_side == 'left' else self.w/2 + 2
-        start_y = self.get_y()
-        
-        # Write question number and text
-        self.set_font('Noto', 'B', self.config.font_sizes['question_number'])
-        self.set_xy(x_start, start_y)
-        self.cell(self.config.spacing['question_number_width'], 5, f"{number}.", 0, 0, 'R')
-        
-        question_x = x_start + self.config.spacing['question_number_width'] + 1
-        self.set_xy(question_x, start_y)
-        self.set_font('ArialUni', 'I', self.config.font_sizes['question'])
-        self.multi_cell(self._question_width, self.config.spacing['line_height'], question_text)
-        
-        # Add some spacing before MTF table
-        current_y = self.get_y() + 2
-        
-        # Render MTF table
-        table_width = self._question_width - 5  # Only left indent, no right gap
-        table_x = question_x + 5  # Indent the table slightly
-        
-        mtf_height = self.render_mtf_table(left_column, right_column, 
-                                          table_x, current_y, table_width)
-        
-        # Move to options section
-        current_y += mtf_height + 3
-        
-        # Write choices using existing logic
-        options_x = question_x + 2
-        i = 0
-        
-        while i < len(choices):
-            if (i + 1 < len(choices) and 
-                self.can_fit_two_options(choices[i], choices[i+1])):
-                # Write two options side by side
-                half_width = (self._options_width - self.config.spacing['option_column_gap']) / 2
-                
-                label1 = f"{chr(65+i)}."
-                is_answer1 = (i == correct_answer_index)
-                option_height1 = self._write_single_option(
-                    label1, choices[i], options_x, current_y, half_width, is_answer1
-                )
-                
-                label2 = f"{chr(65+i+1)}."
-                is_answer2 = (i+1 == correct_answer_index)
-                x2 = options_x + half_width + self.config.spacing['option_column_gap']
-                option_height2 = self._write_single_option(
-                    label2, choices[i+1], x2, current_y, half_width, is_answer2
-                )
-                
-                current_y += max(option_height1, option_height2) + 1
-                i += 2
-            else:
-                # Write single option
-                label = f"{chr(65+i)}."
-                is_answer = (i == correct_answer_index)
-                option_height = self._write_single_option(
-                    label, choices[i], options_x, current_y, self._options_width, is_answer
-                )
-                current_y += option_height + 1
-                i += 1
-        
-        # Add reasoning if needed
-        if reasoning and self.show_answers:
-            current_y += 1
-            self.set_xy(options_x, current_y)
-            self.set_font('Noto', 'B', self.config.font_sizes['option_label'])
-            self.cell(30, 5, "Explanation:", 0, 0)
-            
-            self.set_xy(options_x, current_y + 5)
-            self.set_font('ArialUni', '', self.config.font_sizes['option'])
-            self.multi_cell(self._options_width, self.config.spacing['line_height'], reasoning)
-            current_y = self.get_y() + 2
-        
-        # Set final position
-        self.set_y(current_y + 1)
+        self._render_question(number, question_text, needed_height,
+                              self._render_mtf_block, (left_column, right_column),
+                              choices, correct_answer_index, reasoning)
     
     def measure_mtf_question_height(self, question_text: str, left_column: List[str], 
                                    right_column: List[str], choices: List[str], 
@@ -711,33 +296,13 @@ class EnhancedMCQPaperGenerator(MCQPaperGenerator):
         """Calculate height needed for an MTF question."""
         # Question text height
         question_height = self.estimate_text_height(
-            question_text, self._question_width, self.config.font_sizes['question']
+            question_text, self._question_width, self._question_font_size
         )
         
         total_height = question_height + 2  # Spacing after question
         
         # MTF table height
-        max_items = max(len(left_column), len(right_column))
-        table_width = self._question_width - 5
-        left_width = table_width * 0.45
-        right_width = table_width * 0.45
-        
-        for i in range(max_items):
-            row_height = 0
-            if i < len(left_column):
-                left_height = self.estimate_text_height(
-                    left_column[i], left_width, self.config.font_sizes['option']
-                )
-                row_height = max(row_height, left_height)
-            
-            if i < len(right_column):
-                right_height = self.estimate_text_height(
-                    right_column[i], right_width, self.config.font_sizes['option']
-                )
-                row_height = max(row_height, right_height)
-            
-            # Use the maximum height from both columns for each row
-            total_height += row_height + 1  # Row height + spacing between rows
+        total_height += self._measure_mtf_table_height(left_column, right_column)
         
         total_height += 3  # Spacing after table
 
@@ -745,27 +310,47 @@ class EnhancedMCQPaperGenerator(MCQPaperGenerator):
         total_height += self._calculate_choices_height(choices)
 
         # Reasoning height (use actual render width)
-        if reasoning and self.show_answers:
-            label_adjustment = 4
-            single_option_render_width = self._options_width - label_adjustment
-            reasoning_height = self.estimate_text_height(
-                reasoning, single_option_render_width, self.config.font_sizes['option']
-            )
-            total_height += reasoning_height + 7
+        total_height += self._measure_reasoning_height(reasoning)
 
         return total_height + 2  # Safety buffer
     
+    def _measure_mtf_table_height(self, left_column: List[str], right_column: List[str],
+                                  left_header: Optional[str] = None,
+                                  right_header: Optional[str] = None) -> float:
+        """Calculate the height of the rows render_mtf_table draws, headers included."""
+        estimate = self.estimate_text_height
+        column_width = self._indented_width * 0.45
+        option_font_size = self._option_font_size
+        
+        # Per-column row heights; headers form the first row if they exist
+        left_heights = []
+        right_heights = []
+        if left_header or right_header:
+            header_font_size = self._option_label_font_size
+            left_heights.append(estimate(left_header or '', column_width, header_font_size))
+            right_heights.append(estimate(right_header or '', column_width, header_font_size))
+        
+        # Measure each column in one pass, then combine the heights row by row
+        left_heights.extend(estimate(text, column_width, option_font_size) for text in left_column)
+        right_heights.extend(estimate(text, column_width, option_font_size) for text in right_column)
+        
+        # The shorter column is padded with empty rows, so each row is a plain max
+        table_height = 0
+        for left_height, right_height in zip_longest(left_heights, right_heights, fillvalue=0):
+            table_height += max(left_height, right_height) + 1  # Row height + spacing between rows
+        return table_height
+    
     def measure_statement_question_height(self, question_text: str, statement: str, 
                                         choices: List[str], reasoning: Optional[str] = None) -> float:
         """Calculate height needed for a statement-based question."""
         # Question text height
         question_height = self.estimate_text_height(
-            question_text, self._question_width, self.config.font_sizes['question']
+            question_text, self._question_width, self._question_font_size
         )
         
         # Statement height (with "Statement:" label)
         statement_height = self.estimate_text_height(
-            statement, self._question_width - 5, self.config.font_sizes['option']
+            statement, self._indented_width, self._option_font_size
         ) + 8  # Extra for "Statement:" label
         
         total_height = question_height + statement_height + 5  # Spacing
@@ -774,13 +359,7 @@ class EnhancedMCQPaperGenerator(MCQPaperGenerator):
         total_height += self._calculate_choices_height(choices)
 
         # Reasoning height (use actual render width)
-        if reasoning and self.show_answers:
-            label_adjustment = 4
-            single_option_render_width = self._options_width - label_adjustment
-            reasoning_height = self.estimate_text_height(
-                reasoning, single_option_render_width, self.config.font_sizes['option']
-            )
-            total_height += reasoning_height + 7
+        total_height += self._measure_reasoning_height(reasoning)
 
         return total_height + 2  # Safety buffer
 
@@ -789,15 +368,16 @@ class EnhancedMCQPaperGenerator(MCQPaperGenerator):
         """Calculate height needed for a multiple statement question."""
         # Question text height
         question_height = self.estimate_text_height(
-            question_text, self._question_width, self.config.font_sizes['question']
+            question_text, self._question_width, self._question_font_size
         )
         
         # Statements height
+        estimate = self.estimate_text_height
+        item_width = self._indented_width
+        option_font_size = self._option_font_size
         statements_height = 0
         for statement in statements:
-            stmt_height = self.estimate_text_height(
-                statement, self._question_width - 5, self.config.font_sizes['option']
-            )
+            stmt_height = estimate(statement, item_width, option_font_size)
             statements_height += stmt_height + 1  # Spacing between statements
         
         total_height = question_height + statements_height + 4  # Spacing
@@ -806,13 +386,7 @@ class EnhancedMCQPaperGenerator(MCQPaperGenerator):
         total_height += self._calculate_choices_height(choices)
 
         # Reasoning height (use actual render width)
-        if reasoning and self.show_answers:
-            label_adjustment = 4
-            single_option_render_width = self._options_width - label_adjustment
-            reasoning_height = self.estimate_text_height(
-                reasoning, single_option_render_width, self.config.font_sizes['option']
-            )
-            total_height += reasoning_height + 7
+        total_height += self._measure_reasoning_height(reasoning)
 
         return total_height + 2  # Safety buffer
 
@@ -821,34 +395,28 @@ class EnhancedMCQPaperGenerator(MCQPaperGenerator):
         """Calculate height needed for a sequencing question."""
         # Question text height
         question_height = self.estimate_text_height(
-            question_text, self._question_width, self.config.font_sizes['question']
+            question_text, self._question_width, self._question_font_size
         )
         
         # Sequence items height
+        estimate = self.estimate_text_height
+        item_width = self._indented_width
+        option_font_size = self._option_font_size
         items_height = 0
         for item in sequence_items:
-            item_height = self.estimate_text_height(
-                item, self._question_width - 5, self.config.font_sizes['option']
-            )
+            item_height = estimate(item, item_width, option_font_size)
             items_height += item_height + 1  # Spacing between items
         
         total_height = question_height + items_height + 4  # Spacing
 
         # Choices height (prefer single column for sequencing, use actual render width)
-        label_adjustment = 4
-        single_option_render_width = self._options_width - label_adjustment
+        single_option_render_width = self._single_option_render_width
         for choice in choices:
-            choice_height = self.estimate_text_height(
-                choice, single_option_render_width, self.config.font_sizes['option']
-            )
+            choice_height = estimate(choice, single_option_render_width, option_font_size)
             total_height += choice_height + 1
 
         # Reasoning height (use actual render width)
-        if reasoning and self.show_answers:
-            reasoning_height = self.estimate_text_height(
-                reasoning, single_option_render_width, self.config.font_sizes['option']
-            )
-            total_height += reasoning_height + 7
+        total_height += self._measure_reasoning_height(reasoning)
 
         return total_height + 2  # Safety buffer
     
@@ -857,17 +425,17 @@ class EnhancedMCQPaperGenerator(MCQPaperGenerator):
         """Calculate height needed for a paragraph-based question."""
         # Initial question text height
         question_height = self.estimate_text_height(
-            question_text, self._question_width, self.config.font_sizes['question']
+            question_text, self._question_width, self._question_font_size
         )
         
         # Paragraph height
         paragraph_height = self.estimate_text_height(
-            paragraph, self._question_width - 5, self.config.font_sizes['option']
+            paragraph, self._indented_width, self._option_font_size
         )
         
         # Question text after paragraph height
         question_after_height = self.estimate_text_height(
-            question_text_after, self._question_width, self.config.font_sizes['question']
+            question_text_after, self._question_width, self._question_font_size
         )
         
         total_height = question_height + paragraph_height + question_after_height + 6  # Spacing
@@ -876,111 +444,84 @@ class EnhancedMCQPaperGenerator(MCQPaperGenerator):
         total_height += self._calculate_choices_height(choices)
 
         # Reasoning height (use actual render width)
-        if reasoning and self.show_answers:
-            label_adjustment = 4
-            single_option_render_width = self._options_width - label_adjustment
-            reasoning_height = self.estimate_text_height(
-                reasoning, single_option_render_width, self.config.font_sizes['option']
-            )
-            total_height += reasoning_height + 7
+        total_height += self._measure_reasoning_height(reasoning)
 
         return total_height + 2  # Safety buffer
     
     def _calculate_choices_height(self, choices: List[str]) -> float:
-        """Helper method to calculate choices height."""
-        # Calculate actual rendering widths (accounting for label width of 5mm minus 1mm added back = 4mm)
-        label_adjustment = 4
-        single_option_render_width = self._options_width - label_adjustment
+        """Helper method to calculate choices height.
+
+        Every measure_* helper goes through here, so results are memoized per
+        choice list; stock choice sets ("Only 1", "Both 1 and 2", ...) recur often.
+        """
+        key = tuple(choices)
+        cached = self._choices_height_cache.get(key)
+        if cached is not None:
+            return cached
 
-        # For side-by-side: account for gap and label on each side
-        half_width_before_label = (self._options_width - self.config.spacing['option_column_gap']) / 2
-        half_option_render_width = half_width_before_label - label_adjustment
+        # Actual rendering widths for full-width and side-by-side options
+        single_option_render_width = self._single_option_render_width
+        half_option_render_width = self._half_option_render_width
+        option_font_size = self._option_font_size
+        estimate = self.estimate_text_height
 
         total_height = 0
-        i = 0
-        while i < len(choices):
-            if i + 1 < len(choices) and self.can_fit_two_options(choices[i], choices[i+1]):
+        for i, paired in self._choice_rows(choices):
+            if paired:
                 height = max(
-                    self.estimate_text_height(
-                        choices[i], half_option_render_width, self.config.font_sizes['option']
-                    ),
-                    self.estimate_text_height(
-                        choices[i+1], half_option_render_width, self.config.font_sizes['option']
-                    )
+                    estimate(choices[i], half_option_render_width, option_font_size),
+                    estimate(choices[i+1], half_option_render_width, option_font_size)
                 ) + 0.1
                 total_height += height
-                i += 2
                 continue
 
-            option_height = self.estimate_text_height(
-                choices[i], single_option_render_width, self.config.font_sizes['option']
-            ) + 0.1
+            option_height = estimate(choices[i], single_option_render_width, option_font_size) + 0.1
             total_height += option_height + 0.5
-            i += 1
 
+        self._choices_height_cache[key] = total_height
         return total_height
     
     def add_question(self, number: int, question_text, choices: List[str],
                     correct_answer_index: Optional[int] = None, reasoning: Optional[str] = None,
-                    **kwargs) -> None:
-        """Universal question renderer that processes question_text arrays sequentially."""
+                    needed_height: Optional[float] = None, **kwargs) -> None:
+        """Universal question renderer that processes question_text arrays sequentially.
+
+        ``needed_height`` may be passed when the caller has already measured the
+        question, so it is not measured a second time.
+        """
         
         # Convert single string to array for backward compatibility
         if isinstance(question_text, str):
             question_text = [question_text]
         
+        # Only segments with content are measured or rendered; filter them once
+        segments = [segment for segment in question_text if segment and not segment.isspace()]
+        
         # Calculate total height needed for the entire question
-        needed_height = self._measure_universal_question_height(
-            question_text, choices, reasoning, **kwargs
-        )
+        if needed_height is None:
+            needed_height = self._measure_universal_question_height(
+                segments, choices, reasoning, **kwargs
+            )
         
         safety_buffer = 3
         total_needed_height = needed_height + safety_buffer
         
-        # Check if we need to move to next column/page
-        current_y = self.get_y()
-        footer_buffer = self.footer_buffer
-        effective_page_height = self.h - footer_buffer
-        available_space = effective_page_height - current_y
-        
-        if total_needed_height > available_space:
-            if self.current_side == 'left':
-                right_column_start = self.first_page_offset + 5 if self.page_no() == 1 else 20
-                right_available_space = effective_page_height - right_column_start
-                
-                if total_needed_height <= right_available_space:
-                    self.current_side = 'right'
-                    self.set_xy(self.w/2 + 2, right_column_start)
-                else:
-                    self.add_page()
-                    self.current_side = 'left'
-                    self.set_xy(10, 20)
-            else:
-                self.add_page()
-                self.current_side = 'left'
-                self.set_xy(10, 20)
-            
-            return self.add_question(number, question_text, choices,
-                                   correct_answer_index, reasoning, **kwargs)
-        
-        # Now render the question
-        x_start = 10 if self.current_side == 'left' else self.w/2 + 2
-        start_y = self.get_y()
+        # Move to the next column/page if the question does not fit here
+        x_start, start_y = self._advance_to_fit(total_needed_height)
         
         # Write question number
-        self.set_font('Noto', 'B', self.config.font_sizes['question_number'])
+        self.set_font('Noto', 'B', self._question_number_font_size)
         self.set_xy(x_start, start_y)
-        self.cell(self.config.spacing['question_number_width'], 5, f"{number}.", 0, 0, 'R')
+        self.cell(self._question_number_width, 5, f"{number}.", 0, 0, 'R')
         
-        question_x = x_start + self.config.spacing['question_number_width'] + 1
+        question_x = x_start + self._question_number_width + 1
         current_y = start_y
         
         # Process question_text array sequentially
-        for segment in question_text:
-            if segment.strip():  # Only process non-empty segments
-                current_y = self._render_question_segment(
-                    segment, question_x, current_y, **kwargs
-                )
+        for segment in segments:
+            current_y = self._render_question_segment(
+                segment, question_x, current_y, **kwargs
+            )
         
         # Add spacing before choices
         current_y += 1
@@ -1001,29 +542,37 @@ class EnhancedMCQPaperGenerator(MCQPaperGenerator):
         """Render a single question segment and return the new Y position."""
         self.set_xy(x, y)
         
-        # Check if this is a special keyword
-        if segment == "STATEMENT" or segment == "STATEMENTS":
-            # Handle both old single statement and new multiple statements structure
-            if 'statements' in kwargs:
-                return self._render_statements(kwargs.get('statements', []), x, y)
-            else:
-                # Backward compatibility: single statement
-                return self._render_statement(kwargs.get('statement', ''), x, y)
-        elif segment == "LIST":
-            return self._render_list(kwargs.get('list_items', []), x, y)
-        elif segment == "MTF_DATA":
-            return self._render_mtf_data(kwargs.get('mtf_data', {}), x, y)
-        elif segment == "PARAGRAPH":
-            return self._render_paragraph(kwargs.get('paragraph', ''), x, y)
-        else:
+        handlers = self._segment_handlers.get(segment)
+        if handlers is None:
             # Regular text segment
             return self._render_text(segment, x, y)
+        return handlers[1](kwargs, x, y)
+    
+    def _render_statement_segment(self, kwargs: Dict, x: float, y: float) -> float:
+        """Render a STATEMENT/STATEMENTS segment and return new Y position."""
+        # Handle both old single statement and new multiple statements structure
+        if 'statements' in kwargs:
+            return self._render_statements(kwargs.get('statements', []), x, y)
+        # Backward compatibility: single statement
+        return self._render_statement(kwargs.get('statement', ''), x, y)
+    
+    def _render_list_segment(self, kwargs: Dict, x: float, y: float) -> float:
+        """Render a LIST segment and return new Y position."""
+        return self._render_list(kwargs.get('list_items', []), x, y)
+    
+    def _render_mtf_segment(self, kwargs: Dict, x: float, y: float) -> float:
+        """Render an MTF_DATA segment and return new Y position."""
+        return self._render_mtf_data(kwargs.get('mtf_data', {}), x, y)
+    
+    def _render_paragraph_segment(self, kwargs: Dict, x: float, y: float) -> float:
+        """Render a PARAGRAPH segment and return new Y position."""
+        return self._render_paragraph(kwargs.get('paragraph', ''), x, y)
     
     def _render_text(self, text: str, x: float, y: float) -> float:
         """Render regular text and return new Y position."""
         self.set_xy(x, y)
-        self.set_font('ArialUni', 'I', self.config.font_sizes['question'])
-        self.multi_cell(self._question_width, self.config.spacing['line_height'], text)
+        self.set_font('ArialUni', 'I', self._question_font_size)
+        self.multi_cell(self._question_width, self._line_height, text)
         return self.get_y() + 1  # Add spacing after text
     
     def _render_statement(self, statement: str, x: float, y: float) -> float:
@@ -1033,8 +582,8 @@ class EnhancedMCQPaperGenerator(MCQPaperGenerator):
         
         # "Statement:" label with smaller font size
         self.set_xy(statement_x, current_y)
-        self.set_font('ArialUni', 'B', self.config.font_sizes['option_label'])  # Smaller font size
-        label_height = self.config.spacing['line_height']
+        self.set_font('ArialUni', 'B', self._option_label_font_size)  # Smaller font size
+        label_height = self._line_height
         self.cell(20, label_height, "Statement:", 0, 0)
         
         # Move to next line with proper spacing
@@ -1042,8 +591,8 @@ class EnhancedMCQPaperGenerator(MCQPaperGenerator):
         
         # Render statement content at same indentation as label
         self.set_xy(statement_x, current_y)  # Same indentation as label
-        self.set_font('ArialUni', '', self.config.font_sizes['option'])
-        self.multi_cell(self._question_width - 5, self.config.spacing['line_height'], statement)  # Adjusted width
+        self.set_font('ArialUni', '', self._option_font_size)
+        self.multi_cell(self._indented_width, self._line_height, statement)  # Adjusted width
         
         return self.get_y() + 2  # Add spacing after statement
     
@@ -1051,6 +600,10 @@ class EnhancedMCQPaperGenerator(MCQPaperGenerator):
         """Render multiple statements with labels and return new Y position."""
         current_y = y
         statement_x = x + 5
+        statement_width = self._indented_width
+        line_height = self._line_height
+        label_font_size = self._option_label_font_size
+        text_font_size = self._option_font_size
         
         for i, statement_obj in enumerate(statements):
             if i > 0:
@@ -1063,17 +616,16 @@ class EnhancedMCQPaperGenerator(MCQPaperGenerator):
             text = statement_obj.get('text', '')
             
             self.set_xy(statement_x, current_y)
-            self.set_font('ArialUni', 'B', self.config.font_sizes['option_label'])
-            label_height = self.config.spacing['line_height']
-            self.cell(20, label_height, f"{label}:", 0, 0)
+            self.set_font('ArialUni', 'B', label_font_size)
+            self.cell(20, line_height, f"{label}:", 0, 0)
             
             # Move to next line with proper spacing
-            current_y += label_height + 1
+            current_y += line_height + 1
             
             # Render statement content at same indentation as label
             self.set_xy(statement_x, current_y)
-            self.set_font('ArialUni', '', self.config.font_sizes['option'])
-            self.multi_cell(self._question_width - 5, self.config.spacing['line_height'], text)
+            self.set_font('ArialUni', '', text_font_size)
+            self.multi_cell(statement_width, line_height, text)
             
             current_y = self.get_y() + 1  # Small spacing after each statement
         
@@ -1083,11 +635,13 @@ class EnhancedMCQPaperGenerator(MCQPaperGenerator):
         """Render any list of items and return new Y position."""
         current_y = y + 1
         items_x = x + 5
+        item_width = self._indented_width
+        line_height = self._line_height
         
+        self.set_font('ArialUni', '', self._option_font_size)
         for item in list_items:
             self.set_xy(items_x, current_y)
-            self.set_font('ArialUni', '', self.config.font_sizes['option'])
-            self.multi_cell(self._question_width - 5, self.config.spacing['line_height'], item)
+            self.multi_cell(item_width, line_height, item)
             current_y = self.get_y() + 1
         
         return current_y + 1  # Add spacing after list items
@@ -1095,7 +649,7 @@ class EnhancedMCQPaperGenerator(MCQPaperGenerator):
     def _render_mtf_data(self, mtf_data: Dict, x: float, y: float) -> float:
         """Render MTF table and return new Y position."""
         current_y = y + 1
-        table_width = self._question_width - 5
+        table_width = self._indented_width
         table_x = x + 5
         
         left_column = mtf_data.get('left_column', [])
@@ -1115,230 +669,159 @@ class EnhancedMCQPaperGenerator(MCQPaperGenerator):
         paragraph_x = x + 5
         
         self.set_xy(paragraph_x, current_y)
-        self.set_font('ArialUni', '', self.config.font_sizes['option'])
-        self.multi_cell(self._question_width - 5, self.config.spacing['line_height'], paragraph)
+        self.set_font('ArialUni', '', self._option_font_size)
+        self.multi_cell(self._indented_width, self._line_height, paragraph)
         
         return self.get_y() + 1  # Add spacing after paragraph
     
-    def _render_choices(self, choices: List[str], x: float, y: float, 
-                       correct_answer_index: Optional[int]) -> float:
-        """Render answer choices and return new Y position."""
-        current_y = y
-        i = 0
-        
-        while i < len(choices):
-            if (i + 1 < len(choices) and 
-                self.can_fit_two_options(choices[i], choices[i+1])):
-                # Write two options side by side
-                half_width = (self._options_width - self.config.spacing['option_column_gap']) / 2
-                
-                label1 = f"{chr(65+i)}."
-                is_answer1 = (i == correct_answer_index)
-                option_height1 = self._write_single_option(
-                    label1, choices[i], x, current_y, half_width, is_answer1
-                )
-                
-                label2 = f"{chr(65+i+1)}."
-                is_answer2 = (i+1 == correct_answer_index)
-                x2 = x + half_width + self.config.spacing['option_column_gap']
-                option_height2 = self._write_single_option(
-                    label2, choices[i+1], x2, current_y, half_width, is_answer2
-                )
-                
-                current_y += max(option_height1, option_height2) + 1
-                i += 2
-            else:
-                # Write single option
-                label = f"{chr(65+i)}."
-                is_answer = (i == correct_answer_index)
-                option_height = self._write_single_option(
-                    label, choices[i], x, current_y, self._options_width, is_answer
-                )
-                current_y += option_height + 1
-                i += 1
-        
-        return current_y
-    
     def _render_reasoning(self, reasoning: str, x: float, y: float) -> float:
         """Render reasoning/explanation and return new Y position."""
         current_y = y + 1
         
         self.set_xy(x, current_y)
-        self.set_font('Noto', 'B', self.config.font_sizes['option_label'])
+        self.set_font('Noto', 'B', self._option_label_font_size)
         self.cell(30, 5, "Explanation:", 0, 0)
         
         self.set_xy(x, current_y + 5)
-        self.set_font('ArialUni', '', self.config.font_sizes['option'])
-        self.multi_cell(self._options_width, self.config.spacing['line_height'], reasoning)
+        self.set_font('ArialUni', '', self._option_font_size)
+        self.multi_cell(self._options_width, self._line_height, reasoning)
         
         return self.get_y() + 2
     
     def _measure_universal_question_height(self, question_text: List[str], choices: List[str], 
                                          reasoning: Optional[str] = None, **kwargs) -> float:
         """Calculate height needed for universal question format."""
+        estimate = self.estimate_text_height
+        question_width = self._question_width
+        question_font_size = self._question_font_size
+        handlers = self._segment_handlers
         total_height = 0
         
         # Height for each question segment
         for segment in question_text:
-            if segment.strip():
-                if segment == "STATEMENT" or segment == "STATEMENTS":
-                    # Handle both old single statement and new multiple statements structure
-                    if 'statements' in kwargs:
-                        statements = kwargs.get('statements', [])
-                        for statement_obj in statements:
-                            label_height = self.config.spacing['line_height']
-                            statement_height = self.estimate_text_height(
-                                statement_obj.get('text', ''), self._question_width - 5, self.config.font_sizes['option']
-                            )
-                            total_height += 1 + label_height + 1 + statement_height + 2
-                    else:
-                        # Backward compatibility: single statement
-                        label_height = self.config.spacing['line_height']
-                        statement_height = self.estimate_text_height(
-                            kwargs.get('statement', ''), self._question_width - 5, self.config.font_sizes['option']
-                        )
-                        total_height += 1 + label_height + 1 + statement_height + 2
-                elif segment == "LIST":
-                    list_items = kwargs.get('list_items', [])
-                    for item in list_items:
-                        item_height = self.estimate_text_height(
-                            item, self._question_width - 5, self.config.font_sizes['option']
-                        )
-                        total_height += item_height + 1
-                    total_height += 2
-                elif segment == "MTF_DATA":
-                    mtf_data = kwargs.get('mtf_data', {})
-                    left_column = mtf_data.get('left_column', [])
-                    right_column = mtf_data.get('right_column', [])
-                    left_header = mtf_data.get('left_header')
-                    right_header = mtf_data.get('right_header')
-                    table_width = self._question_width - 5
-                    left_width = table_width * 0.45
-                    right_width = table_width * 0.45
-                    
-                    # Prepare data including headers as first row if they exist
-                    left_data = []
-                    right_data = []
-                    
-                    # Add headers as first row if they exist
-                    if left_header or right_header:
-                        left_data.append(left_header or '')
-                        right_data.append(right_header or '')
-                    
-                    # Add actual data
-                    left_data.extend(left_column)
-                    right_data.extend(right_column)
-                    
-                    max_items = max(len(left_data), len(right_data))
-                    
-                    mtf_height = 0
-                    # Calculate height for all rows (headers + data)
-                    for i in range(max_items):
-                        row_height = 0
-                        # Determine if this is the header row and use appropriate font size
-                        is_header_row = (i == 0 and (left_header or right_header))
-                        font_size = self.config.font_sizes['option_label'] if is_header_row else self.config.font_sizes['option']
-                        
-                        if i < len(left_data):
-                            left_height = self.estimate_text_height(
-                                left_data[i], left_width, font_size
-                            )
-                            row_height = max(row_height, left_height)
-                        if i < len(right_data):
-                            right_height = self.estimate_text_height(
-                                right_data[i], right_width, font_size
-                            )
-                            row_height = max(row_height, right_height)
-                        # Use the maximum height from both columns for each row
-                        mtf_height += row_height + 1  # Row height + spacing between rows
-                    total_height += mtf_height + 5
-                elif segment == "PARAGRAPH":
-                    paragraph_height = self.estimate_text_height(
-                        kwargs.get('paragraph', ''), self._question_width - 5, self.config.font_sizes['option']
-                    )
-                    total_height += paragraph_height + 5
-                else:
+            if segment and not segment.isspace():
+                segment_handlers = handlers.get(segment)
+                if segment_handlers is None:
                     # Regular text
-                    text_height = self.estimate_text_height(
-                        segment, self._question_width, self.config.font_sizes['question']
-                    )
+                    text_height = estimate(segment, question_width, question_font_size)
                     total_height += text_height + 2
+                else:
+                    total_height += segment_handlers[0](kwargs)
         
         # Choices height
         total_height += self._calculate_choices_height(choices)
 
         # Reasoning height (use actual render width)
-        if reasoning and self.show_answers:
-            label_adjustment = 4
-            single_option_render_width = self._options_width - label_adjustment
-            reasoning_height = self.estimate_text_height(
-                reasoning, single_option_render_width, self.config.font_sizes['option']
-            )
-            total_height += reasoning_height + 7
+        total_height += self._measure_reasoning_height(reasoning)
 
         return total_height + 5  # Safety buffer
     
+    def _measure_statement_segment(self, kwargs: Dict) -> float:
+        """Calculate height needed for a STATEMENT/STATEMENTS segment."""
+        estimate = self.estimate_text_height
+        item_width = self._indented_width
+        option_font_size = self._option_font_size
+        label_height = self._line_height
+        
+        # Handle both old single statement and new multiple statements structure
+        if 'statements' in kwargs:
+            texts = [statement_obj.get('text', '') for statement_obj in kwargs.get('statements', [])]
+        else:
+            # Backward compatibility: single statement
+            texts = [kwargs.get('statement', '')]
+        
+        height = 0
+        for text in texts:
+            statement_height = estimate(text, item_width, option_font_size)
+            height += 1 + label_height + 1 + statement_height + 2
+        return height
+    
+    def _measure_list_segment(self, kwargs: Dict) -> float:
+        """Calculate height needed for a LIST segment."""
+        estimate = self.estimate_text_height
+        item_width = self._indented_width
+        option_font_size = self._option_font_size
+        
+        height = 0
+        for item in kwargs.get('list_items', []):
+            height += estimate(item, item_width, option_font_size) + 1
+        return height + 2
+    
+    def _measure_mtf_segment(self, kwargs: Dict) -> float:
+        """Calculate height needed for an MTF_DATA segment."""
+        mtf_data = kwargs.get('mtf_data', {})
+        mtf_height = self._measure_mtf_table_height(
+            mtf_data.get('left_column', []),
+            mtf_data.get('right_column', []),
+            mtf_data.get('left_header'),
+            mtf_data.get('right_header')
+        )
+        return mtf_height + 5
+    
+    def _measure_paragraph_segment(self, kwargs: Dict) -> float:
+        """Calculate height needed for a PARAGRAPH segment."""
+        paragraph_height = self.estimate_text_height(
+            kwargs.get('paragraph', ''), self._indented_width, self._option_font_size
+        )
+        return paragraph_height + 5
+    
+    def _prepare_question(self, question: Dict) -> Tuple[List[str], Optional[str], Dict]:
+        """Return the text segments, reasoning and renderer kwargs for a question."""
+        # Add all question type specific data to kwargs (universal approach)
+        kwargs = {
+            'statement': question.get('statement', ''),
+            'statements': question.get('statements', []),
+            'list_items': question.get('list_items', []),
+            'paragraph': question.get('paragraph', ''),
+            'mtf_data': question.get('mtf_data', {}),
+        }
+        reasoning = question.get('reasoning') if self.show_answers else None
+        return self._get_question_text(question), reasoning, kwargs
+    
     def generate_from_sections(self, sections: List[SectionConfig]) -> int:
         """Enhanced generate_from_sections that handles MTF questions."""
         question_number = 1
         total_marks = 0
+        add_question = self.add_question
         
         for section in sections:
-            selected_questions = section.questions[:section.required_questions]
-            
-            questions_with_numbers = []
-            for q in selected_questions:
-                q_data = q.copy()
-                q_data['number'] = question_number
-                questions_with_numbers.append(q_data)
-                question_number += 1
-            
-            # Calculate height of first question using universal method
-            first_question = questions_with_numbers[0]
-            question_texts = self._get_question_text(first_question)
-            
-            # Prepare kwargs for height calculation
-            height_kwargs = {
-                'statement': first_question.get('statement', ''),
-                'statements': first_question.get('statements', []),
-                'sequence_items': first_question.get('sequence_items', []),
-                'paragraph': first_question.get('paragraph', ''),
-                'mtf_data': first_question.get('mtf_data', {})
-            }
-            
-            first_question_height = self._measure_universal_question_height(
+            # Stream the required questions straight from the section; nothing is copied
+            questions = islice(section.questions, section.required_questions)
+            marks_per_question = section.marks_per_question
+            
+            # The first question decides where the section header goes;
+            # measure it once and reuse the height when placing it
+            question = next(questions)
+            question_texts, reasoning, kwargs = self._prepare_question(question)
+            needed_height = self._measure_universal_question_height(
+                question_texts, question['choices'], reasoning, **kwargs
+            )
+            self.add_section(section.name, section.description, needed_height)
+            add_question(
+                question_number,
                 question_texts,
-                first_question['choices'],
-                first_question.get('reasoning'),
-                **height_kwargs
+                question['choices'],
+                self._answer_index(question),
+                reasoning,
+                needed_height=needed_height,
+                **kwargs
             )
-            
-            # Add section header
-            self.add_section(section.name, section.description, first_question_height)
-            
-            # Add all questions
-            for question in questions_with_numbers:
-                # Prepare kwargs for question-specific data
-                kwargs = {}
-
-                # Add all question type specific data to kwargs (universal approach)
-                kwargs['statement'] = question.get('statement', '')
-                kwargs['statements'] = question.get('statements', [])
-                kwargs['list_items'] = question.get('list_items', [])
-                kwargs['paragraph'] = question.get('paragraph', '')
-                kwargs['mtf_data'] = question.get('mtf_data', {})
-
-                question_texts = self._get_question_text(question)
-
-                self.add_question(
-                    question['number'],
-                    question_texts,  # Use the helper method result
+            total_marks += marks_per_question
+            question_number += 1
+            
+            # The rest of the section needs no per-question special cases
+            for question in questions:
+                question_texts, reasoning, kwargs = self._prepare_question(question)
+                add_question(
+                    question_number,
+                    question_texts,
                     question['choices'],
-                    question['choices'].index(question['answer']) if self.show_answers else None,
-                    question.get('reasoning') if self.show_answers and 'reasoning' in question else None,
+                    self._answer_index(question),
+                    reasoning,
                     **kwargs
                 )
-                total_marks += section.marks_per_question
+                total_marks += marks_per_question
+                question_number += 1
         
         self.draw_end_marker()
         
@@ -1,6 +1,5 @@
 from typing import List, Dict, Optional, Tuple
-from .base_generator import BasePaperGenerator, PaperConfig
-from functools import lru_cache
+from .base_generator import BasePaperGenerator, PaperConfig, _CHOICE_LABELS
 from .styles import PaperStyles
 
 class MCQConfig(PaperConfig):
@@ -271,7 +270,7 @@ class MCQPaperGenerator(BasePaperGenerator):
         double_line_gap = self.config.spacing['header_spacing']['double_line_gap']
         self.line(10, third_line_y + double_line_gap, self.w - 10, third_line_y + double_line_gap)
         self.first_page_offset = third_line_y + double_line_gap  # Adjust the offset to account for the additional line
-        question_area_end_y = self.h - self.footer_buffer
+        question_area_end_y = self._effective_page_height
         self.line(self.w / 2, third_line_y, self.w / 2, question_area_end_y)
         self.set_xy(10, self.first_page_offset + 5)
 
@@ -306,34 +305,15 @@ class MCQPaperGenerator(BasePaperGenerator):
                 0, 0, 'R')
         
         self.line(10, header_y + 10, self.w - 10, header_y + 10)
-        self.line(self.w/2, header_y + 10, self.w/2, self.h - self.footer_buffer)
+        self.line(self.w/2, header_y + 10, self.w/2, self._effective_page_height)
         self.set_xy(10, header_y + 15)
 
     def footer(self) -> None:
-        self.line(10, self.h - self.footer_buffer, self.w - 10, self.h - self.footer_buffer)
+        self.line(10, self._effective_page_height, self.w - 10, self._effective_page_height)
         self.set_y(-10)
         self.set_font('Noto', 'I', self.config.font_sizes['footer'])
         self.cell(0, 5, f'Page {self.page_no()}', 0, 0, 'C')
     
-    @lru_cache(maxsize=1024)
-    def get_cached_string_width(self, text: str, font_family: str, font_style: str, font_size: int) -> float:
-        self.set_font(font_family, font_style, font_size)
-        return self.get_string_width(text)
-    
-    def measure_option_width(self, option_text: str) -> float:
-        return self.get_cached_string_width(
-            f"A. {option_text}",
-            'ArialUni',
-            '',
-            self.config.font_sizes['option']
-        )
-    
-    def can_fit_two_options(self, option1: str, option2: str) -> bool:
-        width1 = self.measure_option_width(option1)
-        width2 = self.measure_option_width(option2)
-        total_width = width1 + width2 + self.config.spacing['option_column_gap']
-        return total_width <= self._options_width
-    
     def write_option(self, label: str, option_text: str, x: float, y: float, 
                     width: float, is_answer: bool = False) -> float:
         """Write a single option and return its height."""
@@ -341,7 +321,7 @@ class MCQPaperGenerator(BasePaperGenerator):
         option_height = self.estimate_text_height(
             f"{label} {option_text}",
             width,
-            self.config.font_sizes['option']
+            self._option_font_size
         )
 
         # Check if we have enough space for this complete option
@@ -350,8 +330,8 @@ class MCQPaperGenerator(BasePaperGenerator):
             return -1  # Return -1 to indicate insufficient space
             
         # Calculate vertical offset to align baseline of different fonts
-        label_font_size = self.config.font_sizes['option_label']
-        option_font_size = self.config.font_sizes['option']
+        label_font_size = self._option_label_font_size
+        option_font_size = self._option_font_size
         
         # Determine font metrics to align baselines
         # Typically, font baseline is approximately at 80% of font height
@@ -375,7 +355,7 @@ class MCQPaperGenerator(BasePaperGenerator):
             self.set_font('ArialUni', '', option_font_size)
             
         # Write the option text aligned with label
-        self.multi_cell(width - label_width + 1, self.config.spacing['line_height'], option_text, align='L')
+        self.multi_cell(width - label_width + 1, self._line_height, option_text, align='L')
         return self.get_y() - y
     
     def write_option_pair(self, options: List[Tuple[str, str, bool]], start_idx: int, 
@@ -384,7 +364,7 @@ class MCQPaperGenerator(BasePaperGenerator):
         if start_idx >= len(options):
             return 0
 
-        half_width = (width - self.config.spacing['option_column_gap']) / 2
+        half_width = (width - self._option_column_gap) / 2
         label1, text1, is_answer1 = options[start_idx]
         
         # Check space for first option
@@ -395,7 +375,7 @@ class MCQPaperGenerator(BasePaperGenerator):
         height2 = 0
         if start_idx + 1 < len(options):
             label2, text2, is_answer2 = options[start_idx + 1]
-            x2 = x + half_width + self.config.spacing['option_column_gap']
+            x2 = x + half_width + self._option_column_gap
             height2 = self.write_option(label2, text2, x2, y, half_width, is_answer2)
             if height2 == -1:  # Insufficient space for second option
                 return -1
@@ -408,224 +388,168 @@ class MCQPaperGenerator(BasePaperGenerator):
         # Set position for label - use same line height as option text
         self.set_xy(x, y)
         label_width = 5
-        self.set_font('Noto', 'B', self.config.font_sizes['option_label'])
-        self.cell(label_width, self.config.spacing['line_height'], label, 0, 0)
+        line_height = self._line_height
+        self.set_font('Noto', 'B', self._option_label_font_size)
+        self.cell(label_width, line_height, label, 0, 0)
         
         # Set position for option text at same baseline
         self.set_xy(x + label_width, y)
         
         # Set font for option text
         if is_answer and self.show_answers:
-            self.set_font('ArialUni', 'B', self.config.font_sizes['option'])
+            self.set_font('ArialUni', 'B', self._option_font_size)
             option_text = option_text + " *"
         else:
-            self.set_font('ArialUni', '', self.config.font_sizes['option'])
+            self.set_font('ArialUni', '', self._option_font_size)
             
         # Write the option text
-        self.multi_cell(width - label_width + 1, self.config.spacing['line_height'], option_text, align='L')
+        self.multi_cell(width - label_width + 1, line_height, option_text, align='L')
         return self.get_y() - y
     
-    def _move_to_next_position(self):
-        """Move to next column or page when current position has insufficient space."""
-        if self.current_side == 'left':
-            # Try right column
-            right_column_start = self.first_page_offset + 5 if self.page_no() == 1 else 20
-            self.current_side = 'right'
-            self.set_xy(self.w/2 + 2, right_column_start)
-        else:
-            # Already on right side, start new page
-            self.add_page()
-            self.current_side = 'left'
-            self.set_xy(10, 20)
+    def _write_question_header(self, number: int, question_text: str, x_start: float, start_y: float) -> float:
+        """Write the question number and text, and return the x position of the text column."""
+        self.set_font('Noto', 'B', self._question_number_font_size)
+        self.set_xy(x_start, start_y)
+        self.cell(self._question_number_width, 5, f"{number}.", 0, 0, 'R')
+        
+        question_x = x_start + self._question_number_width + 1
+        self.set_xy(question_x, start_y)
+        self.set_font('ArialUni', 'I', self._question_font_size)
+        self.multi_cell(self._question_width, self._line_height, question_text)
+        return question_x
     
-    @lru_cache(maxsize=1024)
-    def estimate_text_height(self, text: str, width: float, font_size: int = 12) -> float:
-        self.set_font('Noto', '', font_size)
-        words = text.split()
-        lines = 1
-        current_line = ''
-        
-        for word in words:
-            test_line = current_line + ' ' + word if current_line else word
-            if self.get_string_width(test_line) > width:
-                lines += 1
-                current_line = word
+    def _render_choices(self, choices: List[str], x: float, y: float, 
+                       correct_answer_index: Optional[int]) -> float:
+        """Render answer choices and return new Y position."""
+        current_y = y
+        options_width = self._options_width
+        half_width = self._half_options_width
+        x2 = x + half_width + self._option_column_gap
+        labels = _CHOICE_LABELS
+        write = self._write_single_option
+        
+        for i, paired in self._choice_rows(choices):
+            if paired:
+                # Write two options side by side
+                option_height1 = write(
+                    labels[i], choices[i], x, current_y, half_width, i == correct_answer_index
+                )
+                option_height2 = write(
+                    labels[i+1], choices[i+1], x2, current_y, half_width, i+1 == correct_answer_index
+                )
+                
+                current_y += max(option_height1, option_height2) + 1
             else:
-                current_line = test_line
+                # Write single option
+                option_height = write(
+                    labels[i], choices[i], x, current_y, options_width, i == correct_answer_index
+                )
+                current_y += option_height + 1
         
-        return lines * self.config.spacing['line_height']
-
+        return current_y
+    
     def add_question(self, number: int, question_text: str, choices: List[str], 
-                    correct_answer_index: Optional[int] = None, reasoning: Optional[str] = None) -> None:
-        """Add a question with its options, ensuring they stay together."""
+                    correct_answer_index: Optional[int] = None, reasoning: Optional[str] = None,
+                    needed_height: Optional[float] = None) -> None:
+        """Add a question with its options, ensuring they stay together.
+
+        ``needed_height`` may be passed when the caller has already measured the
+        question, so it is not measured a second time.
+        """
         # This is a complete rewrite to fix the option splitting issue
         
         # Calculate actual height needed more accurately
-        needed_height = self.measure_question_height(question_text, choices, reasoning)
+        if needed_height is None:
+            needed_height = self.measure_question_height(question_text, choices, reasoning)
         safety_buffer = 3  # Reduced buffer for better space utilization
         total_needed_height = needed_height + safety_buffer
 
-        # Get current position and effective page bounds
-        current_y = self.get_y()
-        footer_buffer = self.footer_buffer
-        effective_page_height = self.h - footer_buffer
-        
-        # Calculate available space in current position
-        available_space = effective_page_height - current_y
-        
-        # If not enough space, move to next column or page BEFORE writing anything
-        if total_needed_height > available_space:
-            if self.current_side == 'left':
-                # Try right column
-                right_column_start = self.first_page_offset + 5 if self.page_no() == 1 else 20
-                right_available_space = effective_page_height - right_column_start
-                
-                if total_needed_height <= right_available_space:
-                    # Move to right column
-                    self.current_side = 'right'
-                    self.set_xy(self.w/2 + 2, right_column_start)
-                else:
-                    # Need new page
-                    self.add_page()
-                    self.current_side = 'left'
-                    self.set_xy(10, 20)
-            else:
-                # Already on right side, need new page
-                self.add_page()
-                self.current_side = 'left'
-                self.set_xy(10, 20)
-            
-            # Now call recursively with better positioning
-            return self.add_question(number, question_text, choices, correct_answer_index, reasoning)
-        
-        # Now we have confirmed space - write the question
-        x_start = 10 if self.current_side == 'left' else self.w/2 + 2
-        start_y = self.get_y()
+        # If not enough space, move to next column or page BEFORE writing anything.
+        # Placement is decided once, so an oversized question cannot recurse forever.
+        x_start, start_y = self._advance_to_fit(total_needed_height)
         
         # Write question number and text
-        self.set_font('Noto', 'B', self.config.font_sizes['question_number'])
-        self.set_xy(x_start, start_y)
-        self.cell(self.config.spacing['question_number_width'], 5, f"{number}.", 0, 0, 'R')
-        
-        question_x = x_start + self.config.spacing['question_number_width'] + 1
-        self.set_xy(question_x, start_y)
-        self.set_font('ArialUni', 'I', self.config.font_sizes['question'])
-        self.multi_cell(self._question_width, self.config.spacing['line_height'], question_text)
+        question_x = self._write_question_header(number, question_text, x_start, start_y)
         
         # Write options - use intelligent pairing when possible
         options_x = question_x + 2
         current_y = self.get_y() + 1
-        i = 0
-        
-        while i < len(choices):
-            # Check if we can fit two options side by side
-            if (i + 1 < len(choices) and 
-                self.can_fit_two_options(choices[i], choices[i+1])):
-                # Write two options side by side
-                half_width = (self._options_width - self.config.spacing['option_column_gap']) / 2
-                
-                # First option
-                label1 = f"{chr(65+i)}."
-                is_answer1 = (i == correct_answer_index)
-                option_height1 = self._write_single_option(
-                    label1, choices[i], options_x, current_y, half_width, is_answer1
-                )
-                
-                # Second option  
-                label2 = f"{chr(65+i+1)}."
-                is_answer2 = (i+1 == correct_answer_index)
-                x2 = options_x + half_width + self.config.spacing['option_column_gap']
-                option_height2 = self._write_single_option(
-                    label2, choices[i+1], x2, current_y, half_width, is_answer2
-                )
-                
-                current_y += max(option_height1, option_height2) + 1
-                i += 2
-            else:
-                # Write single option
-                label = f"{chr(65+i)}."
-                is_answer = (i == correct_answer_index)
-                option_height = self._write_single_option(
-                    label, choices[i], options_x, current_y, self._options_width, is_answer
-                )
-                current_y += option_height + 1
-                i += 1
+        current_y = self._render_choices(choices, options_x, current_y, correct_answer_index)
         
         # Add reasoning if needed
         if reasoning and self.show_answers:
             current_y += 1
             self.set_xy(options_x, current_y)
-            self.set_font('Noto', 'B', self.config.font_sizes['option_label'])
+            self.set_font('Noto', 'B', self._option_label_font_size)
             self.cell(30, 5, "Explanation:", 0, 0)
             
             self.set_xy(options_x, current_y + 5)
-            self.set_font('ArialUni', '', self.config.font_sizes['option'])
-            self.multi_cell(self._options_width, self.config.spacing['line_height'], reasoning)
+            self.set_font('ArialUni', '', self._option_font_size)
+            self.multi_cell(self._options_width, self._line_height, reasoning)
             current_y = self.get_y() + 2
         
         # Set final position
         self.set_y(current_y + 1)
 
+    def _measure_reasoning_height(self, reasoning: Optional[str]) -> float:
+        """Return the height of the explanation block, or 0 when it is not printed.
+
+        The text is measured at the single-option render width; the extra 7
+        covers the "Explanation:" label line and padding.
+        """
+        if not (reasoning and self.show_answers):
+            return 0
+        return self.estimate_text_height(
+            reasoning, self._single_option_render_width, self._option_font_size
+        ) + 7
+
     def measure_question_height(self, question_text: str, choices: List[str], reasoning: Optional[str] = None) -> float:
         """Calculate the height needed for a question and its options."""
         # Calculate question text height with minimal padding
         question_height = self.estimate_text_height(
             question_text,
             self._question_width,
-            self.config.font_sizes['question']
+            self._question_font_size
         )
 
         # Add very minimal spacing after question
         total_height = question_height + 1  # Reduced from 1.5 to 1
 
-        # Calculate actual rendering widths (accounting for label width of 5mm minus 1mm added back = 4mm)
-        label_adjustment = 4
-        single_option_render_width = self._options_width - label_adjustment
-
-        # For side-by-side: account for gap and label on each side
-        half_width_before_label = (self._options_width - self.config.spacing['option_column_gap']) / 2
-        half_option_render_width = half_width_before_label - label_adjustment
+        # Actual rendering widths for full-width and side-by-side options
+        single_option_render_width = self._single_option_render_width
+        half_option_render_width = self._half_option_render_width
 
         # Calculate options height with very minimal padding
-        i = 0
-        while i < len(choices):
-            if i + 1 < len(choices) and self.can_fit_two_options(choices[i], choices[i+1]):
+        for i, paired in self._choice_rows(choices):
+            if paired:
                 # For side-by-side options, use actual render width
                 height = max(
                     self.estimate_text_height(
                         choices[i],
                         half_option_render_width,
-                        self.config.font_sizes['option']
+                        self._option_font_size
                     ),
                     self.estimate_text_height(
                         choices[i+1],
                         half_option_render_width,
-                        self.config.font_sizes['option']
+                        self._option_font_size
                     )
                 ) + 0.1  # Reduced from 0.25 to 0.1
                 total_height += height
-                i += 2
                 continue
 
             # For single options, use actual render width
             option_height = self.estimate_text_height(
                 choices[i],
                 single_option_render_width,
-                self.config.font_sizes['option']
+                self._option_font_size
             ) + 0.1  # Reduced from 0.25 to 0.1
 
             total_height += option_height
-            i += 1
             total_height += 0.5  # Reduced from 0.75 to 0.5
 
         # Add height for reasoning if available and we're showing answers
-        if reasoning and self.show_answers:
-            reasoning_height = self.estimate_text_height(
-                reasoning,
-                single_option_render_width,
-                self.config.font_sizes['option']
-            )
-            total_height += reasoning_height + 7  # Extra space for the explanation label and padding
+        total_height += self._measure_reasoning_height(reasoning)
 
         # Add a very minimal buffer for safety
         buffer_space = 2  # Reduced from 3 to 2
@@ -648,7 +572,7 @@ class MCQPaperGenerator(BasePaperGenerator):
         if (current_y + needed_height) > effective_page_height:
             if self.current_side == 'left':
                 # Try right column
-                right_column_start = self.first_page_offset + 5 if self.page_no() == 1 else 20
+                right_column_start = self._column_top
                 right_column_space = effective_page_height - right_column_start
                 
                 # Use a very minimal safety margin
@@ -656,7 +580,7 @@ class MCQPaperGenerator(BasePaperGenerator):
                 if (right_column_space - safety_margin) >= needed_height:
                     # Move to right column if there's enough space
                     self.current_side = 'right'
-                    self.set_xy(self.w/2 + 2, right_column_start)
+                    self.set_xy(self._right_column_x, right_column_start)
                 else:
                     # If right column can't fit, create new page
                     self.add_page()
@@ -670,29 +594,29 @@ class MCQPaperGenerator(BasePaperGenerator):
         
         return True, current_idx
 
+    def _answer_index(self, question: Dict) -> Optional[int]:
+        """Return the index of the correct choice, or None when answers are hidden."""
+        if not self.show_answers:
+            return None
+        return question['choices'].index(question['answer'])
+
     def generate_from_sections(self, sections: List[SectionConfig]) -> int:
         """Generate MCQ paper from sectioned data and return total marks."""
         question_number = 1
         total_marks = 0
         
         for section in sections:
-            # Use exactly the questions provided, limited to required_questions count
+            # Use exactly the questions provided, limited to required_questions count.
+            # Questions are numbered by position, so the source dicts are never copied.
             selected_questions = section.questions[:section.required_questions]
             
-            # Add question numbers and prepare question data
-            questions_with_numbers = []
-            for q in selected_questions:
-                q_data = q.copy()
-                q_data['number'] = question_number
-                questions_with_numbers.append(q_data)
-                question_number += 1
-            
             # Calculate height of first question to prevent orphaned section header
-            first_question = questions_with_numbers[0]
+            first_question = selected_questions[0]
+            first_reasoning = first_question.get('reasoning') if self.show_answers else None
             first_question_height = self.measure_question_height(
                 first_question['question'],
                 first_question['choices'],
-                first_question.get('reasoning')
+                first_reasoning
             )
             
             # Add section header with knowledge of next question's height
@@ -700,33 +624,35 @@ class MCQPaperGenerator(BasePaperGenerator):
             
             # Write the first question immediately after the section header without position adjustment
             self.add_question(
-                first_question['number'],
+                question_number,
                 first_question['question'],
                 first_question['choices'],
-                first_question['choices'].index(first_question['answer']) if self.show_answers else None,
-                first_question.get('reasoning') if self.show_answers and 'reasoning' in first_question else None
+                self._answer_index(first_question),
+                first_reasoning,
+                needed_height=first_question_height
             )
             
             # Add the remaining questions for this section with space optimization
             current_idx = 1  # Start from the second question
-            while current_idx < len(questions_with_numbers):
-                question = questions_with_numbers[current_idx]
+            while current_idx < len(selected_questions):
+                question = selected_questions[current_idx]
+                reasoning = question.get('reasoning') if self.show_answers else None
                 needed_height = self.measure_question_height(
                     question['question'],
                     question['choices'],
-                    question.get('reasoning')
+                    reasoning
                 )
                 
                 # Only adjust position if not using strict ordering
                 if not self.strict_ordering:
                     _, new_idx = self.check_and_adjust_position(
                         needed_height,
-                        questions_with_numbers[current_idx:],
-                        0
+                        selected_questions,
+                        current_idx
                     )
                     
                     # Get potentially reordered question
-                    question = questions_with_numbers[current_idx]
+                    question = selected_questions[current_idx]
                 else:
                     # With strict ordering, just check if we need to adjust position
                     success, _ = self.check_and_adjust_position(needed_height, [], 0)
@@ -734,15 +660,18 @@ class MCQPaperGenerator(BasePaperGenerator):
                         continue
                 
                 self.add_question(
-                    question['number'],
+                    question_number + current_idx,
                     question['question'],
                     question['choices'],
-                    question['choices'].index(question['answer']) if self.show_answers else None,
-                    question.get('reasoning') if self.show_answers and 'reasoning' in question else None
+                    self._answer_index(question),
+                    question.get('reasoning') if self.show_answers else None,
+                    needed_height=needed_height
                 )
                 
                 current_idx += 1
                 total_marks += section.marks_per_question
+            
+            question_number += len(selected_questions)
         
         # Add styled "END" text with gradient-colored asterisks
         self.draw_end_marker()
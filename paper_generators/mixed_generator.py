@@ -1,5 +1,5 @@
 from typing import List, Dict, Optional, Tuple
-from .base_generator import BasePaperGenerator, PaperConfig
+from .base_generator import BasePaperGenerator, PaperConfig, _CHOICE_LABELS
 from .styles import PaperStyles
 
 class MixedConfig(PaperConfig):
@@ -37,6 +37,9 @@ class MixedSectionConfig:
 class MixedPaperGenerator(BasePaperGenerator):
     """Mixed Question Paper Generator with support for MCQ, Answer Writing, and Fill in the Blanks."""
     
+    # Left column, right column, then both columns of a fresh page
+    MAX_PLACEMENT_ATTEMPTS = 4
+    
     def __init__(self, 
                  config: Optional[MixedConfig] = None,
                  show_answers: bool = False,
@@ -65,6 +68,14 @@ class MixedPaperGenerator(BasePaperGenerator):
         )
         
         self.show_student_info = show_student_info  # Store the parameter
+        
+        # (measure, write) handlers for each section type
+        self._section_handlers = {
+            'MCQ': (self._measure_mcq_question, self._write_mcq_question),
+            'AW': (self._measure_aw_question_height, self._write_aw_question),
+            'FB': (self._measure_fb_question, self._write_fb_question),
+            'MTF': (self._measure_mtf_question, self._write_mtf_question),
+        }
 
     def write_option(self, label: str, option_text: str, x: float, y: float, 
                     width: float, is_answer: bool = False) -> float:
@@ -75,8 +86,8 @@ class MixedPaperGenerator(BasePaperGenerator):
             return 0  # Return 0 instead of -1 to match MCQPaperGenerator
         
         # Calculate vertical offset to align baseline of different fonts
-        label_font_size = self.config.font_sizes['option_label']
-        option_font_size = self.config.font_sizes['option']
+        label_font_size = self._option_label_font_size
+        option_font_size = self._option_font_size
         
         # Determine font metrics to align baselines
         # Typically, font baseline is approximately at 80% of font height
@@ -100,7 +111,7 @@ class MixedPaperGenerator(BasePaperGenerator):
             self.set_font('ArialUni', '', option_font_size)
             
         # Write the option text aligned with label
-        self.multi_cell(width - label_width + 1, self.config.spacing['line_height'], option_text, align='L')
+        self.multi_cell(width - label_width + 1, self._line_height, option_text, align='L')
         return self.get_y() - y
     
     def write_option_pair(self, options: List[Tuple[str, str, bool]], start_idx: int, 
@@ -114,14 +125,14 @@ class MixedPaperGenerator(BasePaperGenerator):
         if y > (self.h - footer_buffer):
             return 0  # Return 0 instead of -1 to match MCQPaperGenerator
             
-        half_width = (width - self.config.spacing['option_column_gap']) / 2
+        half_width = (width - self._option_column_gap) / 2
         label1, text1, is_answer1 = options[start_idx]
         height1 = self.write_option(label1, text1, x, y, half_width, is_answer1)
         
         height2 = 0
         if start_idx + 1 < len(options):
             label2, text2, is_answer2 = options[start_idx + 1]
-            x2 = x + half_width + self.config.spacing['option_column_gap']
+            x2 = x + half_width + self._option_column_gap
             height2 = self.write_option(label2, text2, x2, y, half_width, is_answer2)
         
         return max(height1, height2)
@@ -309,7 +320,7 @@ class MixedPaperGenerator(BasePaperGenerator):
         double_line_gap = self.config.spacing['header_spacing']['double_line_gap']
         self.line(10, third_line_y + double_line_gap, self.w - 10, third_line_y + double_line_gap)
         self.first_page_offset = third_line_y + double_line_gap  # Adjust the offset to account for the additional line
-        question_area_end_y = self.h - self.footer_buffer
+        question_area_end_y = self._effective_page_height
         self.line(self.w / 2, third_line_y, self.w / 2, question_area_end_y)
         self.set_xy(10, self.first_page_offset + 5)
 
@@ -344,53 +355,52 @@ class MixedPaperGenerator(BasePaperGenerator):
                 0, 0, 'R')
         
         self.line(10, header_y + 10, self.w - 10, header_y + 10)
-        self.line(self.w/2, header_y + 10, self.w/2, self.h - self.footer_buffer)
+        self.line(self.w/2, header_y + 10, self.w/2, self._effective_page_height)
         self.set_xy(10, header_y + 15)
 
-    def _write_mcq_question(self, number: int, question: Dict) -> None:
-        """Write a multiple choice question with options."""
+    def _retry_placement(self, place, number: int, question: Dict, heights) -> None:
+        """Call a _place_* method until the question fits.
+
+        Every failed attempt moves on to the next column or page first. A question
+        that still does not fit by the last attempt can never fit, so it is written
+        there without the fit check, like oversized blocks in the MCQ generators.
+        """
+        for _ in range(self.MAX_PLACEMENT_ATTEMPTS - 1):
+            if place(number, question, heights):
+                return
+        place(number, question, heights, force=True)
+
+    def _write_mcq_question(self, number: int, question: Dict, needed_height: Optional[float] = None) -> None:
+        """Write a multiple choice question with options.
+
+        ``needed_height`` is the measured question height, when already known.
+        """
         # Calculate total height needed for question and all options
-        needed_height = self._measure_mcq_question_height(question['question'], question['choices'])
+        if needed_height is None:
+            needed_height = self._measure_mcq_question_height(question['question'], question['choices'])
         
+        self._retry_placement(self._place_mcq_question, number, question, needed_height)
+
+    def _place_mcq_question(self, number: int, question: Dict, needed_height: float, force: bool = False) -> bool:
+        """Try to write an MCQ question at the current position.
+
+        Returns False, after moving to the next column or page, if it did not fit.
+        With ``force`` the question is written here regardless.
+        """
         # Check if the question can fit in a single column
-        effective_page_height = self.h - self.footer_buffer
-        column_height = effective_page_height - (self.first_page_offset + 5 if self.page_no() == 1 else 20)
+        effective_page_height = self._effective_page_height
+        column_height = effective_page_height - self._column_top
         
         # If the question is too tall for a single column, we need to adjust our approach
         if needed_height > column_height:
             # Add a buffer to ensure we don't get too close to the bottom
             buffer = 5
             needed_height = min(needed_height, column_height - buffer)
+            # It can never fit, so write it at the top of the next free column
+            force = True
         
-        # Check if current position has enough space and adjust if needed
-        x_start = 10 if self.current_side == 'left' else self.w/2 + 2
-        start_y = self.get_y()
-        
-        # If current position doesn't have enough space, move to next column/page
-        if (start_y + needed_height) > effective_page_height:
-            if self.current_side == 'left':
-                # Try right column
-                right_column_start = self.first_page_offset + 5 if self.page_no() == 1 else 20
-                right_column_space = effective_page_height - right_column_start
-                
-                if right_column_space >= needed_height:
-                    # Move to right column if there's enough space
-                    self.current_side = 'right'
-                    self.set_xy(self.w/2 + 2, right_column_start)
-                else:
-                    # If right column can't fit, create new page
-                    self.add_page()
-                    self.current_side = 'left'
-                    self.set_xy(10, 20)
-            else:
-                # If we're already on right side, always start new page
-                self.add_page()
-                self.current_side = 'left'
-                self.set_xy(10, 20)
-        
-        # Update position after adjustment
-        x_start = 10 if self.current_side == 'left' else self.w/2 + 2
-        start_y = self.get_y()
+        # Move to the next column/page if the question does not fit here
+        x_start, start_y = self._advance_to_fit(needed_height)
     
         # Store current position in case we need to revert
         original_x = x_start
@@ -399,127 +409,73 @@ class MixedPaperGenerator(BasePaperGenerator):
         
         try:
             # Write question number
-            question_number_font_size = self.config.font_sizes['question_number']
-            question_font_size = self.config.font_sizes['question']
+            question_number_font_size = self._question_number_font_size
+            question_font_size = self._question_font_size
             
             self.set_font('Noto', 'B', question_number_font_size)
             self.set_xy(x_start, start_y)
-            self.cell(self.config.spacing['question_number_width'], 5, f"{number}.", 0, 0, 'R')
+            self.cell(self._question_number_width, 5, f"{number}.", 0, 0, 'R')
             
             # Write question text with vertical alignment
-            question_x = x_start + self.config.spacing['question_number_width'] + 1
+            question_x = x_start + self._question_number_width + 1
             self.set_xy(question_x, start_y)
             self.set_font('ArialUni', 'I', question_font_size)
-            self.multi_cell(self._question_width, self.config.spacing['line_height'], question['question'])
+            self.multi_cell(self._question_width, self._line_height, question['question'])
             
             # Prepare options with answer marking
             options = []
             for idx, choice in enumerate(question['choices']):
-                label = f"{chr(65+idx)}."  # A., B., C., D.
                 is_answer = (choice == question.get('answer', None))
-                options.append((label, choice, is_answer))
+                options.append((_CHOICE_LABELS[idx], choice, is_answer))
             
             # Write options
             options_x = question_x + 2
             current_y = self.get_y() + 1
             
             # Calculate remaining space in current column
-            effective_page_height = self.h - self.footer_buffer
+            effective_page_height = self._effective_page_height
             remaining_space = effective_page_height - current_y
             
             # Calculate height needed for options only
             options_height = needed_height - (current_y - start_y)
             
             # If options won't fit in remaining space, move entire question to next column/page
-            if options_height > remaining_space:
+            if not force and options_height > remaining_space:
                 # Revert to original position before adjustment
                 self.set_xy(original_x, original_y)
                 self.current_side = original_side
                 
                 # Move to next column or page
-                if self.current_side == 'left':
-                    # Try right column
-                    right_column_start = self.first_page_offset + 5 if self.page_no() == 1 else 20
-                    self.current_side = 'right'
-                    self.set_xy(self.w/2 + 2, right_column_start)
-                else:
-                    # If we're already on right side, start new page
-                    self.add_page()
-                    self.current_side = 'left'
-                    self.set_xy(10, 20)
+                self._move_to_next_position()
                 
-                # Recursively call _write_mcq_question with the new position
-                self._write_mcq_question(number, question)
-                return
+                return False
             
             # Write options with proper layout
-            option_idx = 0
-            while option_idx < len(options):
-                # Check if we can fit two options side by side
-                if (option_idx + 1 < len(options) and 
-                    self.can_fit_two_options(options[option_idx][1], options[option_idx+1][1])):
-                    height = self.write_option_pair(options, option_idx, options_x, current_y, self._options_width)
-                    
-                    # If options don't fit, move to next column/page
-                    if height == 0:  # Changed from -1 to 0 to match MCQPaperGenerator
+            for option_idx, paired in self._choice_rows(question['choices']):
+                height = self._write_option_row(options, option_idx, paired, options_x, current_y)
+                
+                # If the option row doesn't fit, move to next column/page
+                if height == 0:  # Changed from -1 to 0 to match MCQPaperGenerator
+                    if not force:
                         # Revert to original position before adjustment
                         self.set_xy(original_x, original_y)
                         self.current_side = original_side
                         
                         # Move to next column or page
-                        if self.current_side == 'left':
-                            # Try right column
-                            right_column_start = self.first_page_offset + 5 if self.page_no() == 1 else 20
-                            self.current_side = 'right'
-                            self.set_xy(self.w/2 + 2, right_column_start)
-                        else:
-                            # If we're already on right side, start new page
-                            self.add_page()
-                            self.current_side = 'left'
-                            self.set_xy(10, 20)
+                        self._move_to_next_position()
                         
-                        # Recursively call _write_mcq_question with the new position
-                        self._write_mcq_question(number, question)
-                        return
+                        return False
                     
-                    option_idx += 2
-                else:
-                    height = self.write_option(
-                        options[option_idx][0], 
-                        options[option_idx][1], 
-                        options_x, 
-                        current_y, 
-                        self._options_width, 
-                        options[option_idx][2]
-                    )
+                    # Forced placement: carry the remaining options over instead
+                    self._move_to_next_position()
+                    current_y = self.get_y()
+                    height = self._write_option_row(options, option_idx, paired, options_x, current_y)
                     
-                    # If option doesn't fit, move to next column/page
-                    if height == 0:  # Changed from -1 to 0 to match MCQPaperGenerator
-                        # Revert to original position before adjustment
-                        self.set_xy(original_x, original_y)
-                        self.current_side = original_side
-                        
-                        # Move to next column or page
-                        if self.current_side == 'left':
-                            # Try right column
-                            right_column_start = self.first_page_offset + 5 if self.page_no() == 1 else 20
-                            self.current_side = 'right'
-                            self.set_xy(self.w/2 + 2, right_column_start)
-                        else:
-                            # If we're already on right side, start new page
-                            self.add_page()
-                            self.current_side = 'left'
-                            self.set_xy(10, 20)
-                        
-                        # Recursively call _write_mcq_question with the new position
-                        self._write_mcq_question(number, question)
-                        return
-                    
-                    option_idx += 1
                 current_y += height + 1
             
             # Add spacing after question - match MCQPaperGenerator's spacing (1 unit)
             self.set_y(current_y + 1)  # Changed from 2 to 1 to match MCQPaperGenerator
+            return True
             
         except Exception as e:
             # If anything goes wrong, revert to original position
@@ -527,62 +483,67 @@ class MixedPaperGenerator(BasePaperGenerator):
             self.current_side = original_side
             raise e
             
+    def _write_option_row(self, options: List[Tuple[str, str, bool]], option_idx: int,
+                          paired: bool, x: float, y: float) -> float:
+        """Write one row of options, paired or single, and return its height (0 if it does not fit)."""
+        if paired:
+            return self.write_option_pair(options, option_idx, x, y, self._options_width)
+        label, text, is_answer = options[option_idx]
+        return self.write_option(label, text, x, y, self._options_width, is_answer)
+    
     def _measure_mcq_question_height(self, question_text: str, choices: List[str]) -> float:
         """Calculate the total height needed for an MCQ question with all its options."""
         # Estimate question text height
-        self.set_font('ArialUni', 'I', self.config.font_sizes['question'])
+        self.set_font('ArialUni', 'I', self._question_font_size)
         question_height = self.estimate_text_height(question_text, self._question_width)
 
         # Estimate options height
         total_height = question_height + 1  # Add 1 for spacing after question
 
-        # Calculate actual rendering widths (accounting for label width of 5mm minus 1mm added back = 4mm)
-        label_adjustment = 4
-        single_option_render_width = self._options_width - label_adjustment
-
-        # For side-by-side: account for gap and label on each side
-        half_width_before_label = (self._options_width - self.config.spacing['option_column_gap']) / 2
-        half_option_render_width = half_width_before_label - label_adjustment
+        # Actual rendering widths for full-width and side-by-side options
+        single_option_render_width = self._single_option_render_width
+        half_option_render_width = self._half_option_render_width
 
-        i = 0
-        while i < len(choices):
-            if i + 1 < len(choices) and self.can_fit_two_options(choices[i], choices[i+1]):
+        for i, paired in self._choice_rows(choices):
+            if paired:
                 # For side-by-side options, use actual render width
                 height = max(
                     self.estimate_text_height(
                         choices[i],
                         half_option_render_width,
-                        self.config.font_sizes['option']
+                        self._option_font_size
                     ),
                     self.estimate_text_height(
                         choices[i+1],
                         half_option_render_width,
-                        self.config.font_sizes['option']
+                        self._option_font_size
                     )
                 ) + 0.1  # Minimal padding of 0.1 to match MCQPaperGenerator
                 total_height += height
-                i += 2
                 continue
 
             # For single options, use actual render width
             option_height = self.estimate_text_height(
                 choices[i],
                 single_option_render_width,
-                self.config.font_sizes['option']
+                self._option_font_size
             ) + 0.1  # Minimal padding of 0.1 to match MCQPaperGenerator
 
             total_height += option_height
-            i += 1
             total_height += 0.5  # Add 0.5 between non-side-by-side options to match MCQPaperGenerator
 
         # Add a very minimal buffer for safety
         buffer_space = 2  # 2 to match MCQPaperGenerator
         return total_height + buffer_space
 
+    def _measure_mcq_question(self, question: Dict) -> float:
+        """Calculate the height of an MCQ question from its question dict."""
+        return self._measure_mcq_question_height(question['question'], question['choices'])
+
     def _measure_aw_question_height(self, question: Dict) -> float:
         """Calculate the total height needed for an AW question with potential image."""
         # Estimate question text height
-        self.set_font('ArialUni', 'I', self.config.font_sizes['question'])
+        self.set_font('ArialUni', 'I', self._question_font_size)
         question_height = self.estimate_text_height(question['question'], self._question_width)
         
         # Add image height if present
@@ -608,19 +569,19 @@ class MixedPaperGenerator(BasePaperGenerator):
 
     def _write_aw_question(self, number: int, question: Dict) -> None:
         """Write an answer writing question with potential image."""
-        x_start = 10 if self.current_side == 'left' else self.w/2 + 2
+        x_start = 10 if self.current_side == 'left' else self._right_column_x
         start_y = self.get_y()
         
         # Write question number - use config font size
-        self.set_font('Noto', 'B', self.config.font_sizes['question_number'])
+        self.set_font('Noto', 'B', self._question_number_font_size)
         self.set_xy(x_start, start_y)
-        self.cell(self.config.spacing['question_number_width'], 5, f"{number}.", 0, 0, 'R')
+        self.cell(self._question_number_width, 5, f"{number}.", 0, 0, 'R')
         
         # Write question text
-        question_x = x_start + self.config.spacing['question_number_width'] + 1
+        question_x = x_start + self._question_number_width + 1
         self.set_xy(question_x, start_y)
-        self.set_font('ArialUni', 'I', self.config.font_sizes['question'])
-        self.multi_cell(self._question_width, self.config.spacing['line_height'], question['question'])
+        self.set_font('ArialUni', 'I', self._question_font_size)
+        self.multi_cell(self._question_width, self._line_height, question['question'])
         
         # Add image if present
         if 'image' in question:
@@ -658,7 +619,7 @@ class MixedPaperGenerator(BasePaperGenerator):
     def _measure_fb_question_height(self, question_text: str) -> float:
         """Calculate the total height needed for a Fill in the Blanks question."""
         # Estimate question text height
-        self.set_font('ArialUni', 'I', self.config.font_sizes['question'])
+        self.set_font('ArialUni', 'I', self._question_font_size)
         question_height = self.estimate_text_height(question_text, self._question_width)
         
         # Add space for the blank line and spacing after question
@@ -668,55 +629,45 @@ class MixedPaperGenerator(BasePaperGenerator):
         
         return question_height + blank_line_height + spacing_after
 
-    def _write_fb_question(self, number: int, question: Dict) -> None:
-        """Write a fill in the blanks question."""
-        # First, calculate the height of the question
+    def _measure_fb_question(self, question: Dict) -> float:
+        """Calculate the height of a Fill in the Blanks question from its question dict."""
         question_text = question['question']
         if self.show_answers and 'answer' in question:
             # Replace ___ with answer
             question_text = question_text.replace('___', question['answer'])
-            
-        question_height = self._measure_fb_question_height(question_text)
+        return self._measure_fb_question_height(question_text)
+
+    def _write_fb_question(self, number: int, question: Dict, question_height: Optional[float] = None) -> None:
+        """Write a fill in the blanks question.
+
+        ``question_height`` is the measured question height, when already known.
+        """
+        # First, calculate the height of the question
+        if question_height is None:
+            question_height = self._measure_fb_question(question)
         
+        self._retry_placement(self._place_fb_question, number, question, question_height)
+
+    def _place_fb_question(self, number: int, question: Dict, question_height: float, force: bool = False) -> bool:
+        """Try to write a fill in the blanks question at the current position.
+
+        Returns False, after moving to the next column or page, if it did not fit.
+        With ``force`` the question is written here regardless.
+        """
         # Check if the question can fit in a single column
-        effective_page_height = self.h - self.footer_buffer
-        column_height = effective_page_height - (self.first_page_offset + 5 if self.page_no() == 1 else 20)
+        effective_page_height = self._effective_page_height
+        column_height = effective_page_height - self._column_top
         
         # If the question is too tall for a single column, we need to adjust our approach
         if question_height > column_height:
             # Add a buffer to ensure we don't get too close to the bottom
             buffer = 5
             question_height = min(question_height, column_height - buffer)
+            # It can never fit, so write it at the top of the next free column
+            force = True
         
-        # Check if current position has enough space and adjust if needed
-        x_start = 10 if self.current_side == 'left' else self.w/2 + 2
-        start_y = self.get_y()
-        
-        # If current position doesn't have enough space, move to next column/page
-        if (start_y + question_height) > effective_page_height:
-            if self.current_side == 'left':
-                # Try right column
-                right_column_start = self.first_page_offset + 5 if self.page_no() == 1 else 20
-                right_column_space = effective_page_height - right_column_start
-                
-                if right_column_space >= question_height:
-                    # Move to right column if there's enough space
-                    self.current_side = 'right'
-                    self.set_xy(self.w/2 + 2, right_column_start)
-                else:
-                    # If right column can't fit, create new page
-                    self.add_page()
-                    self.current_side = 'left'
-                    self.set_xy(10, 20)
-            else:
-                # If we're already on right side, always start new page
-                self.add_page()
-                self.current_side = 'left'
-                self.set_xy(10, 20)
-        
-        # Update position after adjustment
-        x_start = 10 if self.current_side == 'left' else self.w/2 + 2
-        start_y = self.get_y()
+        # Move to the next column/page if the question does not fit here
+        x_start, start_y = self._advance_to_fit(question_height)
         
         # Store current position in case we need to revert
         original_x = x_start
@@ -725,14 +676,14 @@ class MixedPaperGenerator(BasePaperGenerator):
         
         try:
             # Write question number
-            self.set_font('Noto', 'B', self.config.font_sizes['question_number'])
+            self.set_font('Noto', 'B', self._question_number_font_size)
             self.set_xy(x_start, start_y)
-            self.cell(self.config.spacing['question_number_width'], 5, f"{number}.", 0, 0, 'R')
+            self.cell(self._question_number_width, 5, f"{number}.", 0, 0, 'R')
             
             # Write question text
-            question_x = x_start + self.config.spacing['question_number_width'] + 1
+            question_x = x_start + self._question_number_width + 1
             self.set_xy(question_x, start_y)
-            self.set_font('ArialUni', 'I', self.config.font_sizes['question'])
+            self.set_font('ArialUni', 'I', self._question_font_size)
             
             # Process question text to add underlines for blanks
             question_text = question['question']
@@ -745,32 +696,22 @@ class MixedPaperGenerator(BasePaperGenerator):
             remaining_space = effective_page_height - current_y
             
             # If question won't fit in remaining space, move entire question to next column/page
-            if question_height > remaining_space:
+            if not force and question_height > remaining_space:
                 # Revert to original position before adjustment
                 self.set_xy(original_x, original_y)
                 self.current_side = original_side
                 
                 # Move to next column or page
-                if self.current_side == 'left':
-                    # Try right column
-                    right_column_start = self.first_page_offset + 5 if self.page_no() == 1 else 20
-                    self.current_side = 'right'
-                    self.set_xy(self.w/2 + 2, right_column_start)
-                else:
-                    # If we're already on right side, start new page
-                    self.add_page()
-                    self.current_side = 'left'
-                    self.set_xy(10, 20)
+                self._move_to_next_position()
                 
-                # Recursively call _write_fb_question with the new position
-                self._write_fb_question(number, question)
-                return
+                return False
             
             # Write the question text
-            self.multi_cell(self._question_width, self.config.spacing['line_height'], question_text)
+            self.multi_cell(self._question_width, self._line_height, question_text)
             
             # Add consistent spacing after question
             self.set_y(self.get_y() + 2)
+            return True
             
         except Exception as e:
             # If anything goes wrong, revert to original position
@@ -778,93 +719,147 @@ class MixedPaperGenerator(BasePaperGenerator):
             self.current_side = original_side
             raise e
 
-    def _write_mtf_question(self, number: int, question: Dict) -> None:
-        """Write a match-the-following question with two columns."""
-        # Calculate total height needed for the entire MTF question
+    def _measure_mtf_question(self, question: Dict) -> float:
+        """Estimate the height of a match-the-following question for placement."""
+        match_pairs = question['match_pairs']
+        left_items = {k: v for k, v in match_pairs.items() if not k.isdigit()}
+        
+        # Base height for question text
+        self.set_font('ArialUni', 'I', self._question_font_size)
+        question_text_height = self.estimate_text_height(question['question'], self._question_width)
+        
+        # Add height for column headers and spacing
+        needed_height = question_text_height + 15
+        
+        # Estimate height for each item in the match pairs
+        available_width = self._question_width
+        col_width = (available_width - 8) / 2  # 8 is spacing between columns
+        
+        label_font_size = self._option_label_font_size
+        option_font_size = self._option_font_size
+        
+        # Every pair is estimated against the first right item; measure it on the first row only
+        right_height = None
+        
+        # Estimate height for each pair
+        for left_key in sorted(left_items.keys()):
+            # Estimate left item height
+            left_text = left_items[left_key]
+            self.set_font('Noto', 'B', label_font_size)
+            left_label = f"{left_key}. "
+            left_label_width = self.get_string_width(left_label)
+            left_content_width = col_width - left_label_width
+            left_height = self.estimate_text_height(left_text, left_content_width, option_font_size)
+            
+            # Estimate right item height (using first right item as approximation)
+            if right_height is None:
+                right_items = {k: v for k, v in match_pairs.items() if k.isdigit()}
+                right_key = sorted(right_items.keys())[0]  # Just use the first one for estimation
+                right_text = right_items[right_key]
+                right_label = f"{right_key}. "
+                right_label_width = self.get_string_width(right_label)
+                right_content_width = col_width - right_label_width
+                right_height = self.estimate_text_height(right_text, right_content_width, option_font_size)
+            
+            # Use maximum height between left and right items
+            pair_height = max(left_height, right_height)
+            needed_height += pair_height + 1  # Add 1 point spacing between pairs to match MCQs
+        
+        # Add final spacing after the question
+        needed_height += 2  # Add 2 points spacing after question to match MCQs
+        return needed_height
+
+    def _measure_mtf_parts(self, question: Dict) -> Tuple[float, float]:
+        """Return the (question text, pairs) heights used to place an MTF question."""
         match_pairs = question['match_pairs']
         left_items = {k: v for k, v in match_pairs.items() if not k.isdigit()}
         right_items = {k: v for k, v in match_pairs.items() if k.isdigit()}
         
-        # Calculate base height for question text and headers
-        self.set_font('ArialUni', 'I', self.config.font_sizes['question'])
+        # Calculate base height for question text
+        self.set_font('ArialUni', 'I', self._question_font_size)
         question_height = self.estimate_text_height(question['question'], self._question_width)
-        headers_height = 7  # Height for Column A/B headers and spacing
         
         # Calculate height needed for all pairs
         available_width = self._question_width
         col_width = (available_width - 8) / 2  # 8 is spacing between columns
         
+        label_font_size = self._option_label_font_size
+        option_font_size = self._option_font_size
+        
         pairs_height = 0
+        right_height = None  # Same first right item for every pair; measured on the first row
         for left_key in sorted(left_items.keys()):
             # Calculate height for each pair
             left_text = left_items[left_key]
             left_label = f"{left_key}. "
             
-            self.set_font('Noto', 'B', self.config.font_sizes['option_label'])
+            self.set_font('Noto', 'B', label_font_size)
             left_label_width = self.get_string_width(left_label)
             left_content_width = col_width - left_label_width
             
-            self.set_font('ArialUni', '', self.config.font_sizes['option'])
+            self.set_font('ArialUni', '', option_font_size)
             left_height = self.estimate_text_height(left_text, left_content_width)
             
             # Get corresponding right item
-            right_key = sorted(right_items.keys())[0]  # Just use first one for height estimation
-            right_text = right_items[right_key]
-            right_label = f"{right_key}. "
-            
-            self.set_font('Noto', 'B', self.config.font_sizes['option_label'])
-            right_label_width = self.get_string_width(right_label)
-            right_content_width = col_width - right_label_width
-            
-            self.set_font('ArialUni', '', self.config.font_sizes['option'])
-            right_height = self.estimate_text_height(right_text, right_content_width)
+            if right_height is None:
+                right_key = sorted(right_items.keys())[0]  # Just use first one for height estimation
+                right_text = right_items[right_key]
+                right_label = f"{right_key}. "
+                
+                self.set_font('Noto', 'B', label_font_size)
+                right_label_width = self.get_string_width(right_label)
+                right_content_width = col_width - right_label_width
+                
+                self.set_font('ArialUni', '', option_font_size)
+                right_height = self.estimate_text_height(right_text, right_content_width)
             
             # Use maximum height between left and right items
             pair_height = max(left_height, right_height)
             pairs_height += pair_height + 1  # Add 1 point spacing between pairs
         
+        return question_height, pairs_height
+
+    def _write_mtf_question(self, number: int, question: Dict,
+                            heights: Optional[Tuple[float, float]] = None) -> None:
+        """Write a match-the-following question with two columns.
+
+        ``heights`` are the measured (question text, pairs) heights, when already known.
+        """
+        # Calculate total height needed for the entire MTF question
+        if heights is None:
+            heights = self._measure_mtf_parts(question)
+        
+        self._retry_placement(self._place_mtf_question, number, question, heights)
+
+    def _place_mtf_question(self, number: int, question: Dict, heights: Tuple[float, float], force: bool = False) -> bool:
+        """Try to write a match-the-following question at the current position.
+
+        Returns False, after moving to the next column or page, if it did not fit.
+        With ``force`` the question is written here regardless.
+        """
+        question_height, pairs_height = heights
+        match_pairs = question['match_pairs']
+        left_items = {k: v for k, v in match_pairs.items() if not k.isdigit()}
+        right_items = {k: v for k, v in match_pairs.items() if k.isdigit()}
+        headers_height = 7  # Height for Column A/B headers and spacing
+        
         # Total height needed
         total_height = question_height + headers_height + pairs_height + 4  # Add 4 points for final spacing
         
         # Check if the question can fit in a single column
-        effective_page_height = self.h - self.footer_buffer
-        column_height = effective_page_height - (self.first_page_offset + 5 if self.page_no() == 1 else 20)
+        effective_page_height = self._effective_page_height
+        column_height = effective_page_height - self._column_top
         
         # If the question is too tall for a single column, we need to adjust our approach
         if total_height > column_height:
             # Add a buffer to ensure we don't get too close to the bottom
             buffer = 5
             total_height = min(total_height, column_height - buffer)
+            # It can never fit, so write it at the top of the next free column
+            force = True
         
-        # Check if current position has enough space and adjust if needed
-        x_start = 10 if self.current_side == 'left' else self.w/2 + 2
-        start_y = self.get_y()
-        
-        # If current position doesn't have enough space, move to next column/page
-        if (start_y + total_height) > effective_page_height:
-            if self.current_side == 'left':
-                # Try right column
-                right_column_start = self.first_page_offset + 5 if self.page_no() == 1 else 20
-                right_column_space = effective_page_height - right_column_start
-                
-                if right_column_space >= total_height:
-                    # Move to right column if there's enough space
-                    self.current_side = 'right'
-                    self.set_xy(self.w/2 + 2, right_column_start)
-                else:
-                    # If right column can't fit, create new page
-                    self.add_page()
-                    self.current_side = 'left'
-                    self.set_xy(10, 20)
-            else:
-                # If we're already on right side, always start new page
-                self.add_page()
-                self.current_side = 'left'
-                self.set_xy(10, 20)
-        
-        # Update position after adjustment
-        x_start = 10 if self.current_side == 'left' else self.w/2 + 2
-        start_y = self.get_y()
+        # Move to the next column/page if the question does not fit here
+        x_start, start_y = self._advance_to_fit(total_height)
         
         # Store current position in case we need to revert
         original_x = x_start
@@ -873,40 +868,29 @@ class MixedPaperGenerator(BasePaperGenerator):
         
         try:
             # Write question number and main question text
-            self.set_font('Noto', 'B', self.config.font_sizes['question_number'])
+            self.set_font('Noto', 'B', self._question_number_font_size)
             self.set_xy(x_start, start_y)
-            self.cell(self.config.spacing['question_number_width'], 5, f"{number}.", 0, 0, 'R')
+            self.cell(self._question_number_width, 5, f"{number}.", 0, 0, 'R')
             
-            question_x = x_start + self.config.spacing['question_number_width'] + 1
+            question_x = x_start + self._question_number_width + 1
             self.set_xy(question_x, start_y)
-            self.set_font('ArialUni', 'I', self.config.font_sizes['question'])
-            self.multi_cell(self._question_width, self.config.spacing['line_height'], question['question'])
+            self.set_font('ArialUni', 'I', self._question_font_size)
+            self.multi_cell(self._question_width, self._line_height, question['question'])
             
             # Calculate remaining space after question text
             current_y = self.get_y()
             remaining_space = effective_page_height - current_y
             
             # If remaining content won't fit, move entire question to next column/page
-            if (remaining_space < (headers_height + pairs_height + 4)):
+            if not force and remaining_space < (headers_height + pairs_height + 4):
                 # Revert to original position before adjustment
                 self.set_xy(original_x, original_y)
                 self.current_side = original_side
                 
                 # Move to next column or page
-                if self.current_side == 'left':
-                    # Try right column
-                    right_column_start = self.first_page_offset + 5 if self.page_no() == 1 else 20
-                    self.current_side = 'right'
-                    self.set_xy(self.w/2 + 2, right_column_start)
-                else:
-                    # If we're already on right side, start new page
-                    self.add_page()
-                    self.current_side = 'left'
-                    self.set_xy(10, 20)
+                self._move_to_next_position()
                 
-                # Recursively call _write_mtf_question with the new position
-                self._write_mtf_question(number, question)
-                return
+                return False
             
             # Move down a bit after the question text
             self.ln(1)
@@ -921,7 +905,7 @@ class MixedPaperGenerator(BasePaperGenerator):
             right_x = question_x + col_width + 8
             
             # Write column headers
-            self.set_font('Noto', 'B', self.config.font_sizes['option_label'])
+            self.set_font('Noto', 'B', self._option_label_font_size)
             self.set_xy(left_x, col_start_y)
             self.cell(col_width, 5, "Column A", 0, 0, 'L')
             self.set_xy(right_x, col_start_y)
@@ -932,43 +916,66 @@ class MixedPaperGenerator(BasePaperGenerator):
             items_start_y = self.get_y()
             current_y = items_start_y
             
+            # Right items are looked up by answer, or in numbered order
+            answer_map = {v: k for k, v in right_items.items()}
+            right_keys = sorted(right_items.keys())
+            label_font_size = self._option_label_font_size
+            option_font_size = self._option_font_size
+            line_height = self._line_height
+            
             for idx, left_key in enumerate(sorted(left_items.keys())):
-                # Write left item
                 left_text = left_items[left_key]
+                if self.show_answers:
+                    # In answer mode, find matching right item
+                    right_key = answer_map.get(left_items[left_key], '?')
+                else:
+                    # In question mode, use corresponding numbered item
+                    right_key = right_keys[idx]
+                right_text = right_items[right_key]
+                
                 left_label = f"{left_key}. "
+                right_label = f"{right_key}. "
+                self.set_font('Noto', 'B', label_font_size)
+                left_label_width = self.get_string_width(left_label)
+                right_label_width = self.get_string_width(right_label)
+                
+                # Forced placement: carry rows that would cross the footer over to the next column
+                if force:
+                    # Count the lines multi_cell will actually produce in the rendering font
+                    self.set_font('ArialUni', '', option_font_size)
+                    row_lines = max(
+                        len(self.multi_cell(col_width - left_label_width, line_height, left_text,
+                                            dry_run=True, output='LINES')),
+                        len(self.multi_cell(col_width - right_label_width, line_height, right_text,
+                                            dry_run=True, output='LINES'))
+                    )
+                    row_height = row_lines * line_height
+                    if current_y + row_height > min(effective_page_height, self.page_break_trigger):
+                        self._move_to_next_position()
+                        current_y = self.get_y()
+                        left_x = self.get_x() + (question_x - x_start)
+                        right_x = left_x + col_width + 8
                 
+                # Write left item
                 self.set_xy(left_x, current_y)
-                self.set_font('Noto', 'B', self.config.font_sizes['option_label'])
-                left_label_width = self.get_string_width(left_label)
+                self.set_font('Noto', 'B', label_font_size)
                 self.cell(left_label_width, 5, left_label, 0, 0)
                 
-                self.set_font('ArialUni', '', self.config.font_sizes['option'])
+                self.set_font('ArialUni', '', option_font_size)
                 self.set_xy(left_x + left_label_width, current_y)
-                self.multi_cell(col_width - left_label_width, self.config.spacing['line_height'], left_text)
+                self.multi_cell(col_width - left_label_width, line_height, left_text)
                 
                 # Get height used by left item
                 left_end_y = self.get_y()
                 
                 # Write right item
-                if self.show_answers:
-                    # In answer mode, find matching right item
-                    answer_map = {v: k for k, v in right_items.items()}
-                    right_key = answer_map.get(left_items[left_key], '?')
-                else:
-                    # In question mode, use corresponding numbered item
-                    right_key = sorted(right_items.keys())[idx]
-                
-                right_text = right_items[right_key]
-                right_label = f"{right_key}. "
-                
                 self.set_xy(right_x, current_y)
-                self.set_font('Noto', 'B', self.config.font_sizes['option_label'])
-                right_label_width = self.get_string_width(right_label)
+                self.set_font('Noto', 'B', label_font_size)
                 self.cell(right_label_width, 5, right_label, 0, 0)
                 
-                self.set_font('ArialUni', '', self.config.font_sizes['option'])
+                self.set_font('ArialUni', '', option_font_size)
                 self.set_xy(right_x + right_label_width, current_y)
-                self.multi_cell(col_width - right_label_width, self.config.spacing['line_height'], right_text)
+                self.multi_cell(col_width - right_label_width, line_height, right_text)
                 
                 # Get height used by right item
                 right_end_y = self.get_y()
@@ -978,6 +985,7 @@ class MixedPaperGenerator(BasePaperGenerator):
             
             # Add final spacing
             self.set_y(current_y + 2)
+            return True
             
         except Exception as e:
             # If anything goes wrong, revert to original position
@@ -988,7 +996,7 @@ class MixedPaperGenerator(BasePaperGenerator):
     def check_and_adjust_position(self, needed_height: float, questions: List[Dict], current_idx: int) -> Tuple[bool, int]:
         """Check if there's enough space for content and adjust position if needed."""
         current_y = self.get_y()
-        effective_page_height = self.h - self.footer_buffer
+        effective_page_height = self._effective_page_height
         
         # Calculate available space from current position
         if self.page_no() == 1:
@@ -1000,13 +1008,13 @@ class MixedPaperGenerator(BasePaperGenerator):
         if (current_y + needed_height) > effective_page_height:
             if self.current_side == 'left':
                 # Try right column
-                right_column_start = self.first_page_offset + 5 if self.page_no() == 1 else 20
+                right_column_start = self._column_top
                 right_column_space = effective_page_height - right_column_start
                 
                 if right_column_space >= needed_height:
                     # Move to right column if there's enough space
                     self.current_side = 'right'
-                    self.set_xy(self.w/2 + 2, right_column_start)
+                    self.set_xy(self._right_column_x, right_column_start)
                 else:
                     # If right column can't fit, create new page
                     self.add_page()
@@ -1022,156 +1030,32 @@ class MixedPaperGenerator(BasePaperGenerator):
 
     def _add_section(self, section: MixedSectionConfig, start_number: int) -> int:
         """Add a section of questions and return the next question number."""
+        # MixedSectionConfig only accepts the section types present in the table
+        measure_question, write_question = self._section_handlers[section.section_type]
+        
         # Calculate height of first question to prevent orphaned section header
         first_question = section.questions[0]
-        
-        # Calculate first question height more precisely based on question type
-        if section.section_type == 'MCQ':
-            # Use the dedicated measurement method for MCQ questions
-            first_question_height = self._measure_mcq_question_height(first_question['question'], first_question['choices'])
-        elif section.section_type == 'AW':
-            # Estimate height for answer writing question
-            first_question_height = self._measure_aw_question_height(first_question)
-        elif section.section_type == 'FB':
-            # Estimate height for fill in the blanks question
-            question_text = first_question['question']
-            if self.show_answers and 'answer' in first_question:
-                # Replace ___ with answer
-                question_text = question_text.replace('___', first_question['answer'])
-            first_question_height = self._measure_fb_question_height(question_text)
-        elif section.section_type == 'MTF':
-            # Estimate height for match-the-following question
-            match_pairs = first_question['match_pairs']
-            left_items = {k: v for k, v in match_pairs.items() if not k.isdigit()}
-            
-            # Base height for question text
-            self.set_font('ArialUni', 'I', self.config.font_sizes['question'])
-            question_text_height = self.estimate_text_height(first_question['question'], self._question_width)
-            
-            # Add height for column headers and spacing
-            first_question_height = question_text_height + 15
-            
-            # Estimate height for each item in the match pairs
-            available_width = self._question_width
-            col_width = (available_width - 8) / 2  # 8 is spacing between columns
-            
-            # Estimate height for each pair
-            for left_key in sorted(left_items.keys()):
-                # Estimate left item height
-                left_text = left_items[left_key]
-                self.set_font('Noto', 'B', self.config.font_sizes['option_label'])
-                left_label = f"{left_key}. "
-                left_label_width = self.get_string_width(left_label)
-                left_content_width = col_width - left_label_width
-                left_height = self.estimate_text_height(left_text, left_content_width, self.config.font_sizes['option'])
-                
-                # Estimate right item height (using first right item as approximation)
-                right_items = {k: v for k, v in match_pairs.items() if k.isdigit()}
-                right_key = sorted(right_items.keys())[0]  # Just use the first one for estimation
-                right_text = right_items[right_key]
-                right_label = f"{right_key}. "
-                right_label_width = self.get_string_width(right_label)
-                right_content_width = col_width - right_label_width
-                right_height = self.estimate_text_height(right_text, right_content_width, self.config.font_sizes['option'])
-                
-                # Use maximum height between left and right items
-                pair_height = max(left_height, right_height)
-                first_question_height += pair_height + 1  # Add 1 point spacing between pairs to match MCQs
-            
-            # Add final spacing after the question
-            first_question_height += 2  # Add 2 points spacing after question to match MCQs
-        else:
-            # Fallback for unknown question types
-            first_question_height = 20  # Base height
+        first_question_height = measure_question(first_question)
         
         # Add section header with knowledge of next question's height
         self.add_section(section.name, section.description, first_question_height)
         
         # Write the first question immediately after the section header without position adjustment
-        if section.section_type == 'MCQ':
-            self._write_mcq_question(start_number, first_question)
-        elif section.section_type == 'AW':
-            self._write_aw_question(start_number, first_question)
-        elif section.section_type == 'FB':
-            self._write_fb_question(start_number, first_question)
-        elif section.section_type == 'MTF':
-            self._write_mtf_question(start_number, first_question)
+        write_question(start_number, first_question)
         
         question_number = start_number + 1
         
         # Write the remaining questions
         for question in section.questions[1:section.required_questions]:
             # Estimate needed height based on question type
-            if section.section_type == 'MCQ':
-                needed_height = self._measure_mcq_question_height(question['question'], question['choices'])
-            elif section.section_type == 'AW':
-                # Estimate height for answer writing question
-                needed_height = self._measure_aw_question_height(question)
-            elif section.section_type == 'FB':
-                # Estimate height for fill in the blanks question
-                question_text = question['question']
-                if self.show_answers and 'answer' in question:
-                    # Replace ___ with answer
-                    question_text = question_text.replace('___', question['answer'])
-                needed_height = self._measure_fb_question_height(question_text)
-            elif section.section_type == 'MTF':
-                # Estimate height for match-the-following question using the same approach as for the first question
-                match_pairs = question['match_pairs']
-                left_items = {k: v for k, v in match_pairs.items() if not k.isdigit()}
-                
-                # Base height for question text
-                self.set_font('ArialUni', 'I', self.config.font_sizes['question'])
-                question_text_height = self.estimate_text_height(question['question'], self._question_width)
-                
-                # Add height for column headers and spacing
-                needed_height = question_text_height + 15
-                
-                # Estimate height for each item in the match pairs
-                available_width = self._question_width
-                col_width = (available_width - 8) / 2  # 8 is spacing between columns
-                
-                # Estimate height for each pair
-                for left_key in sorted(left_items.keys()):
-                    # Estimate left item height
-                    left_text = left_items[left_key]
-                    self.set_font('Noto', 'B', self.config.font_sizes['option_label'])
-                    left_label = f"{left_key}. "
-                    left_label_width = self.get_string_width(left_label)
-                    left_content_width = col_width - left_label_width
-                    left_height = self.estimate_text_height(left_text, left_content_width, self.config.font_sizes['option'])
-                    
-                    # Estimate right item height (using first right item as approximation)
-                    right_items = {k: v for k, v in match_pairs.items() if k.isdigit()}
-                    right_key = sorted(right_items.keys())[0]  # Just use the first one for estimation
-                    right_text = right_items[right_key]
-                    right_label = f"{right_key}. "
-                    right_label_width = self.get_string_width(right_label)
-                    right_content_width = col_width - right_label_width
-                    right_height = self.estimate_text_height(right_text, right_content_width, self.config.font_sizes['option'])
-                    
-                    # Use maximum height between left and right items
-                    pair_height = max(left_height, right_height)
-                    needed_height += pair_height + 1  # Add 1 point spacing between pairs to match MCQs
-                
-                # Add final spacing after the question
-                needed_height += 2  # Add 2 points spacing after question to match MCQs
-            else:
-                # Fallback for unknown question types
-                needed_height = 20  # Base height
+            needed_height = measure_question(question)
             
             # Check if current position has enough space and adjust if needed
             success, _ = self.check_and_adjust_position(needed_height, [], 0)
             if not success:
                 continue
             
-            if section.section_type == 'MCQ':
-                self._write_mcq_question(question_number, question)
-            elif section.section_type == 'AW':
-                self._write_aw_question(question_number, question)
-            elif section.section_type == 'FB':
-                self._write_fb_question(question_number, question)
-            elif section.section_type == 'MTF':
-                self._write_mtf_question(question_number, question)
+            write_question(question_number, question)
             
             question_number += 1
         
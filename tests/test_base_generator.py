@@ -0,0 +1,152 @@
+"""Tests for shared layout helpers on the base paper generator."""
+
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+
+import pytest
+from fpdf import FPDF
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+
+from paper_generators.base_generator import BasePaperGenerator, PaperConfig  # noqa: E402
+
+
+@pytest.fixture
+def generator(monkeypatch):
+    monkeypatch.setattr(BasePaperGenerator, '_section_measure_cache', {})
+    config = PaperConfig(title='School', subtitle='Subtitle', exam_title='Exam')
+    return BasePaperGenerator(config=config)
+
+
+def test_measure_section_is_cached_across_instances(generator, monkeypatch):
+    calls = []
+
+    def fake_estimate(text, width, font_size=12):
+        calls.append(text)
+        return 5.0
+
+    monkeypatch.setattr(generator, 'estimate_text_height', fake_estimate)
+    monkeypatch.setattr(generator, 'set_font', lambda *args, **kwargs: None)
+
+    assert generator._measure_section('Physics', 'Answer all') == (5.0, 5.0)
+    assert calls == ['Physics', 'Answer all']
+
+    other = BasePaperGenerator(config=generator.config)
+    monkeypatch.setattr(other, 'estimate_text_height', fake_estimate)
+    assert other._measure_section('Physics', 'Answer all') == (5.0, 5.0)
+    assert calls == ['Physics', 'Answer all']
+
+
+def test_missing_font_warning_is_logged_once(monkeypatch, caplog):
+    monkeypatch.setattr(BasePaperGenerator, '_global_font_cache', {})
+    config = PaperConfig(title='School', subtitle='Subtitle', exam_title='Exam',
+                         font_paths={'Noto': {'': './fonts/does-not-exist.ttf'}})
+
+    with caplog.at_level('WARNING', logger='paper_generators.base_generator'):
+        BasePaperGenerator(config=config)
+        BasePaperGenerator(config=config)
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages == ['Font file not found: ./fonts/does-not-exist.ttf']
+
+
+def test_estimate_text_height_is_memoized_per_generator(generator, monkeypatch):
+    calls = []
+
+    def fake_wrap(text, width, font_size):
+        calls.append((text, width, font_size))
+        return 4.0
+
+    monkeypatch.setattr(generator, '_wrap_text_height', fake_wrap)
+
+    assert generator.estimate_text_height('Yes', 40.0, 10) == 4.0
+    assert generator.estimate_text_height('Yes', 40.0, 10) == 4.0
+    assert generator.estimate_text_height('Yes', 40.0, 11) == 4.0
+    assert calls == [('Yes', 40.0, 10), ('Yes', 40.0, 11)]
+
+
+def test_set_font_skips_repeated_requests(generator, monkeypatch):
+    calls = []
+    original = FPDF.set_font
+
+    def counting_set_font(self, family=None, style='', size=0):
+        calls.append((family, style, size))
+        return original(self, family, style, size)
+
+    monkeypatch.setattr(FPDF, 'set_font', counting_set_font)
+
+    generator.set_font('Helvetica', 'B', 12)
+    generator.set_font('Helvetica', 'B', 12)
+    assert calls == [('Helvetica', 'B', 12)]
+
+    generator.add_page()  # starting a page clears FPDF's current font
+    calls.clear()
+    generator.set_font('Helvetica', 'B', 12)
+    assert calls == [('Helvetica', 'B', 12)]
+
+
+def test_estimate_text_height_memo_is_bounded(generator, monkeypatch):
+    monkeypatch.setattr(generator, 'TEXT_HEIGHT_CACHE_SIZE', 2)
+    monkeypatch.setattr(generator, '_wrap_text_height', lambda text, width, font_size: 4.0)
+
+    for text in ('A', 'B', 'C'):
+        generator.estimate_text_height(text, 40.0, 10)
+
+    assert list(generator._text_height_cache) == [('B', 40.0, 10), ('C', 40.0, 10)]
+
+
+def test_column_top_is_refreshed_on_each_page(generator, monkeypatch):
+    monkeypatch.setattr(generator, 'footer', lambda: None)
+
+    generator.add_page()
+    assert generator._column_top == generator.first_page_offset + 5
+
+    generator.add_page()
+    assert generator._column_top == 20
+
+
+def test_measure_section_cache_is_keyed_on_measurement_font(generator, monkeypatch):
+    monkeypatch.setattr(BasePaperGenerator, 'estimate_text_height', lambda self, text, width, font_size=12: 5.0)
+    monkeypatch.setattr(BasePaperGenerator, 'set_font', lambda self, *args, **kwargs: None)
+    generator._measure_section('Physics', 'Answer all')
+
+    config = PaperConfig(title='School', subtitle='Subtitle', exam_title='Exam',
+                         font_paths={'Noto': {'': './fonts/Other-Regular.ttf'}})
+    BasePaperGenerator(config=config)._measure_section('Physics', 'Answer all')
+
+    assert len(BasePaperGenerator._section_measure_cache) == 2
+
+
+def test_measure_section_cache_is_bounded(generator, monkeypatch):
+    monkeypatch.setattr(BasePaperGenerator, 'SECTION_MEASURE_CACHE_SIZE', 2)
+    monkeypatch.setattr(generator, 'estimate_text_height', lambda text, width, font_size=12: 5.0)
+    monkeypatch.setattr(generator, 'set_font', lambda *args, **kwargs: None)
+
+    for name in ('A', 'B', 'C'):
+        generator._measure_section(name, 'Answer all')
+
+    assert [key[0] for key in BasePaperGenerator._section_measure_cache] == ['B', 'C']
+
+
+def test_word_units_cache_is_bounded_per_font(generator, monkeypatch):
+    monkeypatch.setattr(BasePaperGenerator, '_word_units_cache', {})
+    monkeypatch.setattr(BasePaperGenerator, 'WORD_UNITS_CACHE_SIZE', 2)
+    generator.current_font = SimpleNamespace(cw={ord(c): 500 for c in ' abc'}, ttffile='fake.ttf')
+
+    assert generator._count_wrapped_lines(['a', 'b', 'c'], 1000.0) == 1
+
+    assert list(BasePaperGenerator._word_units_cache['fake.ttf']) == ['b', 'c']
+
+
+def test_additive_widths_falls_back_when_fpdf_internals_are_missing(generator, monkeypatch):
+    monkeypatch.setattr(BasePaperGenerator, 'is_ttf_font', True, raising=False)
+    generator.current_font = SimpleNamespace(cw={}, ttffile='fake.ttf')
+    assert generator._has_additive_widths('text')
+
+    monkeypatch.delattr(generator, '_fallback_font_ids')
+    assert not generator._has_additive_widths('text')
@@ -1,5 +1,6 @@
 """Tests for enhanced MCQ paper builder helpers."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 
@@ -83,3 +84,49 @@ def test_generate_sets_falls_back_to_default_config(tmp_path, monkeypatch):
     assert "Set A" in result
     assert captured_configs
     assert captured_configs[0].title == "Standard High School"
+
+
+def test_generate_papers_parallel_labels_papers_past_z(monkeypatch):
+    class DummyGenerator:
+        def __init__(self, *_, config=None, **__):
+            pass
+
+        def set_set_name(self, name):
+            self.set_name = name
+
+        def add_page(self):
+            pass
+
+        def generate_from_sections(self, sections):
+            return 0
+
+        def output(self):
+            return bytearray(self.set_name.encode())
+
+    # Threads share the patched generator, so no real fonts or processes are needed
+    monkeypatch.setattr(builder, 'EnhancedMCQPaperGenerator', DummyGenerator)
+    monkeypatch.setattr(builder, 'ProcessPoolExecutor', ThreadPoolExecutor)
+    section = builder.SectionConfig(**_sample_section())
+    config = builder.MCQConfig(title='School', subtitle='Subtitle', exam_title='Exam')
+
+    papers = builder.generate_papers_parallel([[section]] * 28, config, n_workers=2)
+    assert papers[0] == b'A'
+    assert papers[25:] == [b'Z', b'AA', b'AB']
+
+    papers = builder.generate_papers_parallel([[section]] * 2, config, set_names=['X', 'Y'])
+    assert papers == [b'X', b'Y']
+
+    with pytest.raises(ValueError):
+        builder.generate_papers_parallel([[section]] * 2, config, set_names=['X'])
+
+
+@pytest.mark.skipif(not (PROJECT_ROOT / 'fonts').is_dir(), reason='paper fonts are not installed')
+def test_generate_papers_parallel_returns_pdf_bytes_in_order(monkeypatch):
+    monkeypatch.chdir(PROJECT_ROOT)
+    section = builder.SectionConfig(**_sample_section())
+    config = builder.MCQConfig(title='School', subtitle='Subtitle', exam_title='Exam')
+
+    papers = builder.generate_papers_parallel([[section], [section]], config, n_workers=2)
+
+    assert len(papers) == 2
+    assert all(paper.startswith(b'%PDF') for paper in papers)
@@ -0,0 +1,27 @@
+"""Tests for placement helpers on the mixed paper generator."""
+
+from pathlib import Path
+import sys
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+
+from paper_generators.mixed_generator import MixedConfig, MixedPaperGenerator  # noqa: E402
+
+
+def test_retry_placement_forces_oversized_question_on_last_attempt():
+    config = MixedConfig(title='School', subtitle='Subtitle', exam_title='Exam')
+    generator = MixedPaperGenerator(config=config)
+    attempts = []
+
+    def never_fits(number, question, heights, force=False):
+        attempts.append(force)
+        return force
+
+    generator._retry_placement(never_fits, 1, {}, 500.0)
+
+    expected = [False] * (MixedPaperGenerator.MAX_PLACEMENT_ATTEMPTS - 1) + [True]
+    assert attempts == expected